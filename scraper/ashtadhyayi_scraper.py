@@ -1,1049 +1,2267 @@
-# -*- coding: utf-8 -*-
-"""
-Ashtadhyayi.com Universal Book Scraper v3.0
-===========================================
-A comprehensive scraper for all books on ashtadhyayi.com
-
-Supported Books:
-- shivasutra (14 sutras)
-- sutraani (3981 sutras) 
-- dhatu (2000+ verbs)
-- shabda (1000s nouns)
-- pratyahara (44+ entries)
-- ganapatha (450 groups)
-- unadipatha (750 sutras)
-- linganushasanam (200 rules)
-- shiksha (60 shlokas)
-
-Usage:
-    python ashtadhyayi_scraper.py --book shivasutra
-    python ashtadhyayi_scraper.py --book sutraani --limit 100
-    python ashtadhyayi_scraper.py --book dhatu --output ./my_books
-
-Author: Auto-generated
-Date: 2025-12-24
-"""
-
-import os
-import re
-import sys
-import time
-import json
-import argparse
-from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass, field
-from pathlib import Path
-
-# Try to import required packages
-try:
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.common.exceptions import TimeoutException, NoSuchElementException
-except ImportError:
-    print("❌ Selenium not found. Please install: pip install selenium")
-    sys.exit(1)
-
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    print("❌ BeautifulSoup not found. Please install: pip install beautifulsoup4")
-    sys.exit(1)
-
-
-# =====================================
-# Data Classes
-# =====================================
-
-@dataclass
-class EntryInfo:
-    """Individual entry (sutra, dhatu, shabda, etc.)"""
-    number: str
-    title: str
-    url: str
-    content: str = ""
-    sections: Dict[str, str] = field(default_factory=dict)
-    notes: List[str] = field(default_factory=list)
-    metadata: Dict[str, str] = field(default_factory=dict)  # For kaumudi, gana, etc.
-
-
-@dataclass
-class ChapterInfo:
-    """Chapter/Section information"""
-    number: str
-    name: str
-    url: str
-    entries: List[EntryInfo] = field(default_factory=list)
-
-
-@dataclass
-class BookInfo:
-    """Book information"""
-    name: str
-    sanskrit_name: str
-    header_shlokas: List[str]
-    footer_title: str
-    base_url: str
-    book_type: str  # shivasutra, sutraani, dhatu, etc.
-    chapters: List[ChapterInfo] = field(default_factory=list)
-
-
-# =====================================
-# Book Configurations
-# =====================================
-
-BOOK_CONFIGS = {
-    'shivasutra': {
-        'url': 'https://ashtadhyayi.com/shivasutra/',
-        'detail_url_pattern': '/shivasutra/{num}',
-        'has_infinite_scroll': False,
-        'organize_by': 'flat',  # All in one folder
-        'expected_count': 14,
-    },
-    'sutraani': {
-        'url': 'https://ashtadhyayi.com/sutraani',
-        'detail_url_pattern': '/sutraani/{a}/{p}/{s}',
-        'has_infinite_scroll': True,
-        'organize_by': 'adhyaya_pada',  # Nested folders
-        'expected_count': 3981,
-    },
-    'dhatu': {
-        'url': 'https://ashtadhyayi.com/dhatu/',
-        'detail_url_pattern': '/dhatu/{id}',
-        'has_infinite_scroll': True,
-        'organize_by': 'gana',  # Group by गण
-        'expected_count': 2000,
-    },
-    'pratyahara': {
-        'url': 'https://ashtadhyayi.com/pratyahara',
-        'detail_url_pattern': None,  # Single page
-        'has_infinite_scroll': False,
-        'organize_by': 'flat',
-        'expected_count': 44,
-    },
-    'ganapatha': {
-        'url': 'https://ashtadhyayi.com/ganapath/',
-        'detail_url_pattern': '/ganapath/{id}',
-        'has_infinite_scroll': True,
-        'organize_by': 'flat',
-        'expected_count': 450,
-    },
-    'unadipatha': {
-        'url': 'https://ashtadhyayi.com/unaadi/',
-        'detail_url_pattern': '/unaadi/{id}',
-        'has_infinite_scroll': True,
-        'organize_by': 'flat',
-        'expected_count': 750,
-    },
-    'linganushasanam': {
-        'url': 'https://ashtadhyayi.com/linganushasanam',
-        'detail_url_pattern': '/linganushasanam/{id}',
-        'has_infinite_scroll': False,
-        'organize_by': 'flat',
-        'expected_count': 200,
-    },
-    'shiksha': {
-        'url': 'https://ashtadhyayi.com/shiksha',
-        'detail_url_pattern': '/shiksha/{id}',
-        'has_infinite_scroll': False,
-        'organize_by': 'flat',
-        'expected_count': 60,
-    },
-}
-
-
-# =====================================
-# Main Scraper Class
-# =====================================
-
-class AshtadhyayiScraper:
-    """
-    Universal scraper for ashtadhyayi.com
-    Handles all book types with automatic structure detection
-    """
-    
-    BASE_URL = "https://ashtadhyayi.com"
-    
-    # Devanagari to English number mapping
-    DEVA_TO_ENG = {
-        '०': '0', '१': '1', '२': '2', '३': '3', '४': '4', 
-        '५': '5', '६': '6', '७': '7', '८': '8', '९': '9',
-        # Gujarati numerals (sometimes appear)
-        '૦': '0', '૧': '1', '૨': '2', '૩': '3', '૪': '4',
-        '૫': '5', '૬': '6', '૭': '7', '૮': '8', '૯': '9',
-    }
-    
-    def __init__(self, output_dir: str = "books", headless: bool = True, 
-                 delay: float = 1.5, limit: int = None, verbose: bool = True):
-        """
-        Initialize the scraper
-        
-        Args:
-            output_dir: Directory to save markdown files
-            headless: Run browser in headless mode
-            delay: Delay between requests (seconds)
-            limit: Maximum entries to scrape (None for all)
-            verbose: Print progress messages
-        """
-        self.output_dir = Path(output_dir)
-        self.delay = delay
-        self.limit = limit
-        self.verbose = verbose
-        self.driver = None
-        self.headless = headless
-        
-    def log(self, message: str):
-        """Print message if verbose mode is on"""
-        if self.verbose:
-            print(message)
-        
-    def _init_driver(self):
-        """Initialize Chrome WebDriver"""
-        self.log("🔧 Initializing Chrome WebDriver...")
-        options = Options()
-        if self.headless:
-            options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--lang=hi,sa,en")
-        options.add_experimental_option('prefs', {
-            'intl.accept_languages': 'hi,sa,en'
-        })
-        
-        try:
-            self.driver = webdriver.Chrome(options=options)
-            self.log("✅ Chrome WebDriver initialized successfully")
-        except Exception as e:
-            self.log(f"❌ Failed to initialize Chrome: {e}")
-            raise
-    
-    def _close_driver(self):
-        """Close WebDriver"""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
-    
-    def _wait_for_content(self, selector: str, timeout: int = 15) -> bool:
-        """Wait for element to be present"""
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-            return True
-        except TimeoutException:
-            return False
-    
-    def _get_page_source(self, url: str, wait_selector: str = None) -> Optional[str]:
-        """Navigate to URL and get page source after JavaScript renders"""
-        try:
-            self.log(f"   📥 Loading: {url}")
-            self.driver.get(url)
-            time.sleep(self.delay)
-            
-            if wait_selector:
-                self._wait_for_content(wait_selector, timeout=15)
-            else:
-                self._wait_for_content("#list-group-content, .list-group-content, .list-group", timeout=15)
-            
-            return self.driver.page_source
-        except Exception as e:
-            self.log(f"   ❌ Error loading {url}: {e}")
-            return None
-    
-    def _deva_to_english(self, text: str) -> str:
-        """Convert Devanagari/Gujarati numbers to English"""
-        return "".join(self.DEVA_TO_ENG.get(c, c) for c in str(text))
-    
-    def _html_to_markdown(self, html: str) -> str:
-        """Convert HTML content to well-formatted Markdown - keeps paragraphs together"""
-        if not html:
-            return ""
-        
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # First pass: Mark paragraph boundaries with special markers
-        PARA_BREAK = "\n\n【PARA】\n\n"
-        LINE_BREAK = "\n"
-        
-        # Handle prakriya (derivation) boxes - convert to blockquotes
-        for prakriya in soup.select('.prakriya, .derivation, .prakriya-box'):
-            text = prakriya.get_text(strip=True)
-            if text:
-                new_tag = soup.new_string(f"{PARA_BREAK}> {text}{PARA_BREAK}")
-                prakriya.replace_with(new_tag)
-        
-        # Handle section headers (major section titles)
-        for header in soup.select('.section-header, h3, h4, h5'):
-            text = header.get_text(strip=True)
-            if text:
-                new_tag = soup.new_string(f"{PARA_BREAK}### {text}{PARA_BREAK}")
-                header.replace_with(new_tag)
-        
-        # Handle bold text inline
-        for bold in soup.select('b, strong'):
-            text = bold.get_text(strip=True)
-            if text:
-                bold.replace_with(f"**{text}**")
-        
-        # Handle font-weight-bold (often key terms)
-        for bold in soup.select('.font-weight-bold, .bigtext-font'):
-            text = bold.get_text(strip=True)
-            if text:
-                bold.replace_with(f"**{text}**")
-        
-        # Handle italic text inline
-        for italic in soup.select('i, em'):
-            text = italic.get_text(strip=True)
-            if text:
-                italic.replace_with(f"*{text}*")
-        
-        # Handle <br> as line breaks within paragraph
-        for br in soup.select('br'):
-            br.replace_with(LINE_BREAK)
-        
-        # Handle section separators as paragraph breaks
-        for sep in soup.select('.section-separator, hr'):
-            sep.replace_with(f"{PARA_BREAK}---{PARA_BREAK}")
-        
-        # Handle divs with significant margin as paragraph breaks
-        for div in soup.select('div.mt-3, div.mt-4, div.mb-3, div.mb-4'):
-            # Add paragraph break before and after
-            text = div.get_text(strip=True)
-            if text:
-                div.replace_with(f"{PARA_BREAK}{text}{PARA_BREAK}")
-        
-        # Handle links - convert to inline
-        for link in soup.select('a'):
-            text = link.get_text(strip=True)
-            href = link.get('href', '')
-            if text and href:
-                link.replace_with(f"[{text}]({href})")
-            elif text:
-                link.replace_with(text)
-        
-        # Get text with single space separator (not newline!)
-        # This keeps inline text together
-        text = soup.get_text(separator=' ')
-        
-        # Clean up the text
-        # Replace multiple spaces with single space
-        text = re.sub(r'[ \t]+', ' ', text)
-        
-        # Process paragraph markers
-        # Split by paragraph markers
-        paragraphs = text.split('【PARA】')
-        
-        result_paragraphs = []
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
-            
-            # Handle derivation arrows - format nicely
-            if '→' in para and not para.startswith('>'):
-                # Split derivation steps
-                steps = para.split('→')
-                if len(steps) > 1:
-                    formatted_steps = []
-                    for i, step in enumerate(steps):
-                        step = step.strip()
-                        if step:
-                            if i == 0:
-                                formatted_steps.append(step)
-                            else:
-                                formatted_steps.append(f"→ {step}")
-                    para = "\n\n".join(formatted_steps)
-            
-            result_paragraphs.append(para)
-        
-        # Join paragraphs with double newlines
-        text = '\n\n'.join(result_paragraphs)
-        
-        # Final cleanup
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'\*\*\s*\*\*', '', text)  # Remove empty bolds
-        text = re.sub(r'\s+([।॥,;:.])', r'\1', text)  # Fix punctuation spacing
-        text = text.strip()
-        
-        return text
-    
-    def _scroll_to_load_all(self, max_scrolls: int = 500) -> int:
-        """Scroll page to load all content (for infinite scroll pages)"""
-        self.log("   📜 Loading all content (infinite scroll)...")
-        
-        last_count = 0
-        scroll_count = 0
-        no_change_count = 0
-        
-        while scroll_count < max_scrolls:
-            # Get current count of items
-            items = self.driver.find_elements(By.CSS_SELECTOR, "a[href].d-block, .list-group-item a[href]")
-            current_count = len(items)
-            
-            if current_count == last_count:
-                no_change_count += 1
-                if no_change_count >= 5:  # No new items after 5 scrolls
-                    break
-            else:
-                no_change_count = 0
-                last_count = current_count
-            
-            # Apply limit if set
-            if self.limit and current_count >= self.limit:
-                self.log(f"   ⏹️ Reached limit of {self.limit} entries")
-                break
-            
-            # Scroll down
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.5)
-            scroll_count += 1
-            
-            if scroll_count % 20 == 0:
-                self.log(f"   📊 Loaded {current_count} entries...")
-        
-        self.log(f"   ✅ Total entries loaded: {last_count}")
-        return last_count
-    
-    def _parse_main_page_header(self, soup: BeautifulSoup) -> Tuple[str, List[str], str]:
-        """Parse header content (title, shlokas, footer)"""
-        # Main title
-        title_elem = soup.select_one(".list-group-title")
-        main_title = title_elem.get_text(strip=True) if title_elem else ""
-        
-        # Header shlokas
-        header_shlokas = []
-        header_items = soup.select("#list-group-content > .bg-light.list-group-item, " +
-                                   "#list-group-content > .list-group-item.bg-light, " +
-                                   ".list-group-item.text-center.bg-light")
-        for item in header_items:
-            text = item.get_text(strip=True)
-            if text and not item.select_one("a[href]"):
-                header_shlokas.append(text)
-        
-        # Footer title
-        footer_elem = soup.select_one(".list-group-end-title")
-        footer_title = footer_elem.get_text(strip=True) if footer_elem else ""
-        
-        return main_title, header_shlokas, footer_title
-    
-    def _parse_entry_links(self, soup: BeautifulSoup, book_type: str) -> List[Dict[str, Any]]:
-        """Parse entry links from main page based on book type"""
-        results = []
-        
-        # Select all entry items
-        if book_type == 'sutraani':
-            items = soup.select("a.d-block[href^='/sutraani/'], a[href^='/sutraani/'].href")
-        elif book_type == 'dhatu':
-            items = soup.select("a[href^='/dhatu/']")
-        else:
-            items = soup.select("#list-group-content .list-group-item")
-        
-        for item in items:
-            entry_data = self._parse_single_entry(item, book_type)
-            if entry_data:
-                results.append(entry_data)
-                
-                if self.limit and len(results) >= self.limit:
-                    break
-        
-        return results
-    
-    def _parse_single_entry(self, item, book_type: str) -> Optional[Dict[str, Any]]:
-        """Parse a single entry from the list"""
-        # For sutraani
-        if book_type == 'sutraani':
-            if item.name == 'a' and item.get('href', '').startswith('/sutraani/'):
-                href = item.get('href')
-                
-                # IMPORTANT: Filter out non-sutra links like /sutraani/z, /sutraani/skn, etc.
-                # Valid sutra URLs have format: /sutraani/adhyaya/pada/sutra (4 parts)
-                parts = href.strip('/').split('/')
-                if len(parts) != 4:  # Must be sutraani/A/P/S
-                    return None
-                
-                # Check if the last 3 parts are numbers
-                try:
-                    adhyaya, pada, sutra_num = parts[1], parts[2], parts[3]
-                    int(adhyaya), int(pada), int(sutra_num)
-                except ValueError:
-                    return None  # Not a valid sutra URL
-                
-                # Get number from badge
-                badge = item.select_one('.badge, .font-weight-bold')
-                number = badge.get_text(strip=True) if badge else f"{adhyaya}.{pada}.{sutra_num}"
-                
-                # Get title from sutra-text
-                title_elem = item.select_one('.sutra-text, .list-item-title, div:not(.badge):not(.float-right)')
-                title = ""
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                
-                # Get kaumudi reference from float-right
-                kaumudi_elem = item.select_one('.float-right, .text-right, .text-dark')
-                kaumudi = ""
-                if kaumudi_elem:
-                    text = kaumudi_elem.get_text(strip=True)
-                    if 'कौमुदी' in text:
-                        kaumudi = text
-                
-                # If title not found, try getting full text minus number and kaumudi
-                if not title:
-                    full_text = item.get_text(strip=True)
-                    if number:
-                        full_text = full_text.replace(number, '', 1)
-                    if kaumudi:
-                        full_text = full_text.replace(kaumudi, '', 1)
-                    title = full_text.strip()
-                
-                # Get notes (siblings with bullet points)
-                notes = []
-                sibling = item.find_next_sibling()
-                while sibling and sibling.name != 'a':
-                    text = sibling.get_text(strip=True)
-                    if text.startswith('•'):
-                        notes.append(text)
-                    sibling = sibling.find_next_sibling()
-                
-                return {
-                    'number': number,
-                    'title': title,
-                    'url': self.BASE_URL + href,
-                    'notes': notes,
-                    'metadata': {'kaumudi': kaumudi} if kaumudi else {},
-                    'adhyaya': adhyaya,
-                    'pada': pada,
-                    'sutra': sutra_num
-                }
-        
-        # For simple books (shivasutra, etc.)
-        else:
-            # Skip bg-light items (header shlokas)
-            if 'bg-light' in item.get('class', []):
-                return None
-            
-            link = item.select_one("a[href]")
-            if not link:
-                return None
-            
-            href = link.get('href', '')
-            if not href or href == '#':
-                return None
-            
-            # Get number
-            badge = item.select_one(".badge")
-            number = badge.get_text(strip=True) if badge else ""
-            
-            # Get title
-            title_elem = item.select_one(".list-item-title")
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            
-            # Build URL
-            if href.startswith('/'):
-                full_url = self.BASE_URL + href
-            elif href.startswith('http'):
-                full_url = href
-            else:
-                full_url = self.BASE_URL + '/' + href
-            
-            # Get inline notes
-            notes = []
-            note_elems = item.select(".list-item-text, .text-primary")
-            for note in note_elems:
-                text = note.get_text(strip=True)
-                if text:
-                    notes.append(text)
-            
-            return {
-                'number': number,
-                'title': title,
-                'url': full_url,
-                'notes': notes,
-                'metadata': {}
-            }
-    
-    def _parse_detail_page(self, url: str) -> Optional[Dict[str, Any]]:
-        """Parse individual entry detail page"""
-        html = self._get_page_source(url)
-        if not html:
-            return None
-        
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Get title from title-font or list-group-title
-        title_elem = soup.select_one(".title-font, .list-group-title")
-        title = title_elem.get_text(strip=True) if title_elem else ""
-        
-        # Parse number from title (format: १.१.१ वृद्धिरादैच्)
-        parts = title.split(" ", 1) if title else ["", ""]
-        number = parts[0].strip()
-        entry_title = parts[1].strip() if len(parts) > 1 else title
-        
-        # Get main content and sections
-        sections = {}
-        main_content = ""
-        summary_content = ""
-        
-        # === EXTRACT SUMMARY SECTION (पदच्छेद, अनुवृत्ति, etc.) ===
-        summary_region = soup.select_one("#sutra-summary-region")
-        if summary_region:
-            summary_items = []
-            for item in summary_region.select(".list-group-item, .row"):
-                label_elem = item.select_one(".col-3, .col-4, .text-muted, label")
-                value_elem = item.select_one(".col-9, .col-8")
-                if label_elem and value_elem:
-                    label = label_elem.get_text(strip=True).rstrip(':')
-                    value = value_elem.get_text(strip=True)
-                    if label and value:
-                        summary_items.append(f"**{label}:** {value}")
-                else:
-                    # Single item
-                    text = item.get_text(strip=True)
-                    if text and len(text) < 200:
-                        summary_items.append(text)
-            
-            if summary_items:
-                summary_content = "\n\n".join(summary_items)
-        
-        # === EXTRACT MAIN MEANING (Short definition) ===
-        short_meaning = ""
-        short_elem = soup.select_one(".bigtext-font, .sutra-meaning-short")
-        if short_elem:
-            short_meaning = f"**{short_elem.get_text(strip=True)}**"
-        
-        # === EXTRACT MAIN EXPLANATION from sutrartha region ===
-        sutrartha = soup.select_one("#sutra-commentary-sutrartha-region .sutra-commentary")
-        if sutrartha:
-            main_content = self._html_to_markdown(sutrartha.decode_contents())
-        
-        # Combine short meaning with main content
-        if short_meaning and main_content:
-            main_content = f"{short_meaning}\n\n{main_content}"
-        elif short_meaning:
-            main_content = short_meaning
-        
-        # Add summary to sections if available
-        if summary_content:
-            sections["सूत्र-विवरण (Summary)"] = summary_content
-        
-        # === GET ALL COMMENTARY SECTIONS ===
-        commentary_regions = soup.select("[id^='sutra-commentary-'][id$='-region']")
-        for region in commentary_regions:
-            # Skip sutrartha (already captured as main content)
-            if 'sutrartha' in region.get('id', ''):
-                continue
-            
-            # Get section title
-            title_elem = region.select_one(".list-item-title-color")
-            section_name = title_elem.get_text(strip=True) if title_elem else ""
-            if not section_name:
-                continue
-            
-            # Get section content
-            content_elem = region.select_one(".sutra-commentary")
-            if content_elem:
-                content_text = self._html_to_markdown(content_elem.decode_contents())
-                if content_text.strip():
-                    sections[section_name] = content_text
-        
-        # Fallback: If no sutrartha found, try getting from first list-group-item
-        if not main_content:
-            first_content = soup.select_one(".bigtext-font, .font-weight-bold")
-            if first_content:
-                main_content = first_content.get_text(strip=True)
-        
-        return {
-            'number': number,
-            'title': entry_title,
-            'content': main_content,
-            'sections': sections
-        }
-    
-    def scrape_book(self, book_name: str) -> BookInfo:
-        """
-        Scrape a complete book
-        
-        Args:
-            book_name: Name of book (shivasutra, sutraani, dhatu, etc.)
-        
-        Returns:
-            BookInfo object with all scraped data
-        """
-        if book_name not in BOOK_CONFIGS:
-            available = ", ".join(BOOK_CONFIGS.keys())
-            raise ValueError(f"Unknown book: {book_name}. Available: {available}")
-        
-        config = BOOK_CONFIGS[book_name]
-        self._init_driver()
-        
-        try:
-            self.log(f"\n📚 Scraping book: {book_name}")
-            self.log(f"   URL: {config['url']}")
-            
-            # Load main page
-            html = self._get_page_source(config['url'])
-            if not html:
-                raise Exception("Failed to load main page")
-            
-            # Handle infinite scroll
-            if config['has_infinite_scroll']:
-                self._scroll_to_load_all()
-                html = self.driver.page_source
-            
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Parse header
-            sanskrit_name, header_shlokas, footer_title = self._parse_main_page_header(soup)
-            self.log(f"   📜 Title: {sanskrit_name}")
-            self.log(f"   📝 Header shlokas: {len(header_shlokas)}")
-            
-            # Parse entry links
-            entries_data = self._parse_entry_links(soup, book_name)
-            self.log(f"   📋 Found {len(entries_data)} entries")
-            
-            # Create book object
-            book = BookInfo(
-                name=book_name,
-                sanskrit_name=sanskrit_name,
-                header_shlokas=header_shlokas,
-                footer_title=footer_title,
-                base_url=config['url'],
-                book_type=book_name,
-                chapters=[]
-            )
-            
-            # Create chapter for entries
-            chapter = ChapterInfo(
-                number="1",
-                name=book_name,
-                url=config['url'],
-                entries=[]
-            )
-            
-            # Scrape each entry's detail page
-            for i, data in enumerate(entries_data, 1):
-                if self.limit and i > self.limit:
-                    break
-                
-                self.log(f"\n   [{i}/{len(entries_data)}] {data.get('number', '')}. {data.get('title', '')[:30]}...")
-                
-                # Get detail page content
-                detail = self._parse_detail_page(data['url'])
-                
-                entry = EntryInfo(
-                    number=data.get('number', ''),
-                    title=data.get('title', ''),
-                    url=data['url'],
-                    content=detail['content'] if detail else '',
-                    sections=detail['sections'] if detail else {},
-                    notes=data.get('notes', []),
-                    metadata=data.get('metadata', {})
-                )
-                
-                if not entry.number:
-                    entry.number = detail['number'] if detail else str(i)
-                if not entry.title:
-                    entry.title = detail['title'] if detail else ''
-                
-                chapter.entries.append(entry)
-                time.sleep(self.delay)
-            
-            book.chapters.append(chapter)
-            self.log(f"\n✅ Successfully scraped {len(chapter.entries)} entries")
-            
-            return book
-            
-        finally:
-            self._close_driver()
-    
-    def save_to_markdown(self, book: BookInfo, output_dir: str = None) -> Path:
-        """Save book to markdown files"""
-        output_path = Path(output_dir) if output_dir else self.output_dir
-        book_dir = output_path / book.name
-        book_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.log(f"\n📁 Saving to: {book_dir}")
-        
-        config = BOOK_CONFIGS.get(book.book_type, {})
-        organize_by = config.get('organize_by', 'flat')
-        
-        # Create README.md
-        readme = self._create_readme(book)
-        readme_path = book_dir / "README.md"
-        with open(readme_path, 'w', encoding='utf-8') as f:
-            f.write(readme)
-        self.log(f"   ✅ Created: README.md")
-        
-        # Create entry files
-        for chapter in book.chapters:
-            for entry in chapter.entries:
-                # Determine file path based on organization
-                if organize_by == 'adhyaya_pada' and '.' in entry.number:
-                    parts = self._deva_to_english(entry.number).split('.')
-                    if len(parts) >= 3:
-                        adhyaya_dir = book_dir / f"adhyaya_{parts[0]}"
-                        pada_dir = adhyaya_dir / f"pada_{parts[1]}"
-                        pada_dir.mkdir(parents=True, exist_ok=True)
-                        filename = f"sutra_{parts[2].zfill(3)}.md"
-                        file_path = pada_dir / filename
-                    else:
-                        filename = self._get_entry_filename(entry)
-                        file_path = book_dir / filename
-                else:
-                    filename = self._get_entry_filename(entry)
-                    file_path = book_dir / filename
-                
-                # Create markdown content
-                md_content = self._create_entry_markdown(entry, book)
-                
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(md_content)
-                
-                self.log(f"   ✅ Created: {file_path.relative_to(book_dir)}")
-        
-        self.log(f"\n🎉 All files saved to: {book_dir}")
-        return book_dir
-    
-    def _get_entry_filename(self, entry: EntryInfo) -> str:
-        """Generate filename for entry"""
-        eng_num = self._deva_to_english(entry.number)
-        
-        # Handle dot-separated numbers
-        if '.' in eng_num:
-            parts = eng_num.split('.')
-            eng_num = '_'.join(p.zfill(2) for p in parts)
-        elif eng_num.isdigit():
-            eng_num = eng_num.zfill(2)
-        
-        return f"entry_{eng_num}.md"
-    
-    def _create_readme(self, book: BookInfo) -> str:
-        """Create README.md content"""
-        readme = f"""<div align="center">
-
-# {book.sanskrit_name if book.sanskrit_name else book.name.title()}
-
-"""
-        
-        # Add header shlokas
-        for shloka in book.header_shlokas:
-            readme += f"*{shloka}*\n\n"
-        
-        readme += f"""---
-
-📖 **स्रोतः (Source):** [{book.base_url}]({book.base_url})
-
-</div>
-
----
-
-## 📋 सूचि (Index)
-
-| क्र. | नाम | विवरणम् |
-|:---:|:-----|:--------|
-"""
-        
-        config = BOOK_CONFIGS.get(book.book_type, {})
-        organize_by = config.get('organize_by', 'flat')
-        
-        for chapter in book.chapters:
-            for entry in chapter.entries:
-                eng_num = self._deva_to_english(entry.number)
-                
-                # Generate correct file path based on organization
-                if organize_by == 'adhyaya_pada' and hasattr(entry, 'metadata') and entry.metadata.get('adhyaya'):
-                    adhyaya = entry.metadata.get('adhyaya', '1')
-                    pada = entry.metadata.get('pada', '1')
-                    sutra = entry.metadata.get('sutra', '1')
-                    filepath = f"adhyaya_{adhyaya}/pada_{pada}/sutra_{str(sutra).zfill(3)}.md"
-                elif '.' in eng_num and organize_by == 'adhyaya_pada':
-                    parts = eng_num.split('.')
-                    if len(parts) >= 3:
-                        filepath = f"adhyaya_{parts[0]}/pada_{parts[1]}/sutra_{parts[2].zfill(3)}.md"
-                    else:
-                        filepath = self._get_entry_filename(entry)
-                else:
-                    filepath = self._get_entry_filename(entry)
-                
-                # Add metadata if available
-                extra = ""
-                if entry.metadata.get('kaumudi'):
-                    extra = f" ({entry.metadata['kaumudi']})"
-                
-                readme += f"| {entry.number} | **{entry.title}**{extra} | [{filepath}](./{filepath}) |\n"
-        
-        readme += f"""
----
-
-<div align="center">
-
-{f"*{book.footer_title}*" if book.footer_title else ""}
-
-</div>
-"""
-        return readme
-    
-    def _create_entry_markdown(self, entry: EntryInfo, book: BookInfo) -> str:
-        """Create markdown content for an entry"""
-        md = f"""<div align="center">
-
-# {entry.number}. {entry.title}
-
-"""
-        
-        # Add metadata
-        if entry.metadata.get('kaumudi'):
-            md += f"**{entry.metadata['kaumudi']}**\n\n"
-        
-        md += f"""📖 **स्रोतः:** [{entry.url}]({entry.url})
-
-</div>
-
----
-
-## 📜 विवरणम् (Explanation)
-
-{entry.content if entry.content else "*विवरणं अनुपलब्धम्*"}
-
-"""
-        
-        # Add notes
-        if entry.notes:
-            md += """---
-
-## 📝 टिप्पणी (Notes)
-
-"""
-            for note in entry.notes:
-                md += f"- {note}\n"
-            md += "\n"
-        
-        # Add sections
-        for section_name, section_content in entry.sections.items():
-            if section_content.strip() and not section_name.startswith("Additional_"):
-                md += f"""---
-
-## 📖 {section_name}
-
-{section_content}
-
-"""
-        
-        # Navigation footer
-        md += f"""---
-
-<div align="center">
-
-[🏠 मुख्यपृष्ठम्](./README.md)
-
-</div>
-"""
-        return md
-
-
-# =====================================
-# CLI Interface
-# =====================================
-
-def main():
-    """Main entry point with CLI support"""
-    parser = argparse.ArgumentParser(
-        description="🕉️ Ashtadhyayi.com Universal Book Scraper",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python ashtadhyayi_scraper.py --book shivasutra
-  python ashtadhyayi_scraper.py --book sutraani --limit 100
-  python ashtadhyayi_scraper.py --book dhatu --output ./my_books --delay 2.0
-  
-Available Books:
-  shivasutra, sutraani, dhatu, pratyahara, ganapatha, 
-  unadipatha, linganushasanam, shiksha
-        """
-    )
-    
-    parser.add_argument(
-        '--book', '-b',
-        required=True,
-        choices=list(BOOK_CONFIGS.keys()),
-        help="Book to scrape"
-    )
-    
-    parser.add_argument(
-        '--output', '-o',
-        default='./books',
-        help="Output directory (default: ./books)"
-    )
-    
-    parser.add_argument(
-        '--limit', '-l',
-        type=int,
-        default=None,
-        help="Maximum entries to scrape (for testing)"
-    )
-    
-    parser.add_argument(
-        '--delay', '-d',
-        type=float,
-        default=1.5,
-        help="Delay between requests in seconds (default: 1.5)"
-    )
-    
-    parser.add_argument(
-        '--no-headless',
-        action='store_true',
-        help="Show browser window (for debugging)"
-    )
-    
-    parser.add_argument(
-        '--quiet', '-q',
-        action='store_true',
-        help="Suppress progress messages"
-    )
-    
-    args = parser.parse_args()
-    
-    print("=" * 60)
-    print("🕉️  Ashtadhyayi.com Universal Book Scraper v3.0")
-    print("=" * 60)
-    print(f"📚 Book: {args.book}")
-    print(f"📁 Output: {args.output}")
-    if args.limit:
-        print(f"⏹️ Limit: {args.limit} entries")
-    print("=" * 60)
-    
-    # Create scraper
-    scraper = AshtadhyayiScraper(
-        output_dir=args.output,
-        headless=not args.no_headless,
-        delay=args.delay,
-        limit=args.limit,
-        verbose=not args.quiet
-    )
-    
-    try:
-        # Scrape the book
-        book = scraper.scrape_book(args.book)
-        
-        # Save to Markdown
-        output_path = scraper.save_to_markdown(book, output_dir=args.output)
-        
-        print("\n" + "=" * 60)
-        print(f"✅ SUCCESS! Files saved to: {output_path}")
-        print("=" * 60)
-        
-    except Exception as e:
-        print(f"\n❌ ERROR: {e}")
-        import traceback
-        traceback.print_exc()
-        return 1
-    
-    return 0
-
-
-if __name__ == "__main__":
-    sys.exit(main())
+# -*- coding: utf-8 -*-
+"""
+Ashtadhyayi.com Universal Book Scraper v3.0
+===========================================
+A comprehensive scraper for all books on ashtadhyayi.com
+
+Supported Books:
+- shivasutra (14 sutras)
+- sutraani (3981 sutras) 
+- dhatu (2000+ verbs)
+- shabda (1000s nouns)
+- pratyahara (44+ entries)
+- ganapatha (450 groups)
+- unadipatha (750 sutras)
+- linganushasanam (200 rules)
+- shiksha (60 shlokas)
+
+Usage:
+    python ashtadhyayi_scraper.py --book shivasutra
+    python ashtadhyayi_scraper.py --book sutraani --limit 100
+    python ashtadhyayi_scraper.py --book dhatu --output ./my_books
+
+Author: Auto-generated
+Date: 2025-12-24
+"""
+
+import os
+import re
+import sys
+import gzip
+import zlib
+import time
+import json
+import atexit
+import asyncio
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Tuple, Any
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Selenium is by far the slowest import here and is only needed once a
+# browser actually launches; it is loaded lazily by _load_selenium() so
+# --help, cache-only re-runs and the master-list JSON path never pay for
+# it. The names stay None until the first _init_driver call.
+webdriver = None
+Options = Service = By = WebDriverWait = EC = None
+TimeoutException = NoSuchElementException = None
+
+
+def _load_selenium():
+    """Import Selenium on first browser use, binding the module globals"""
+    global webdriver, Options, Service, By, WebDriverWait, EC
+    global TimeoutException, NoSuchElementException
+    if webdriver is not None:
+        return
+    try:
+        from selenium import webdriver as _webdriver
+        from selenium.webdriver.chrome.options import Options as _Options
+        from selenium.webdriver.chrome.service import Service as _Service
+        from selenium.webdriver.common.by import By as _By
+        from selenium.webdriver.support.ui import WebDriverWait as _WebDriverWait
+        from selenium.webdriver.support import expected_conditions as _EC
+        from selenium.common.exceptions import (
+            TimeoutException as _TimeoutException,
+            NoSuchElementException as _NoSuchElementException,
+        )
+    except ImportError:
+        print("❌ Selenium not found. Please install: pip install selenium")
+        sys.exit(1)
+    webdriver = _webdriver
+    Options = _Options
+    Service = _Service
+    By = _By
+    WebDriverWait = _WebDriverWait
+    EC = _EC
+    TimeoutException = _TimeoutException
+    NoSuchElementException = _NoSuchElementException
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter, Retry
+except ImportError:
+    print("❌ Requests not found. Please install: pip install requests")
+    sys.exit(1)
+
+try:
+    from bs4 import BeautifulSoup
+    from bs4.element import Tag
+except ImportError:
+    print("❌ BeautifulSoup not found. Please install: pip install beautifulsoup4")
+    sys.exit(1)
+
+# Prefer the C-based lxml parser (5-10x faster than html.parser);
+# fall back gracefully if lxml is not installed
+try:
+    import lxml  # noqa: F401
+    from lxml import etree
+    from lxml import html as lxml_html
+    BS_PARSER = 'lxml'
+except ImportError:
+    BS_PARSER = 'html.parser'
+    etree = lxml_html = None
+
+# Optional: selectolax parses and CSS-queries fully in C, which is much
+# faster than BeautifulSoup for the extract-a-few-fields hot path.
+# The newer Lexbor engine is preferred; fall back to the Modest engine
+# for older selectolax builds
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser
+        HAS_SELECTOLAX = True
+    except ImportError:
+        HAS_SELECTOLAX = False
+
+# Optional: orjson serializes 3-10x faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: Playwright renders JS pages with far less per-command
+# overhead than Selenium's HTTP-JSON protocol (--engine playwright)
+try:
+    from playwright.async_api import async_playwright
+    HAS_PLAYWRIGHT = True
+except ImportError:
+    HAS_PLAYWRIGHT = False
+
+# Optional: httpx enables the async prefetch path (--async); HTTP/2
+# multiplexing additionally needs the h2 package
+try:
+    import httpx
+    try:
+        import h2  # noqa: F401
+        HTTPX_HTTP2 = True
+    except ImportError:
+        HTTPX_HTTP2 = False
+except ImportError:
+    httpx = None
+    HTTPX_HTTP2 = False
+
+# Optional: zstandard compresses the book cache faster and tighter than
+# gzip; the cache falls back to gzip when it is not installed
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Everything a corrupt/stale book cache file can raise on load: I/O and
+# truncation, bad gzip/zstd streams, and malformed or outdated JSON
+# (an old schema surfaces as TypeError from EntryInfo(**entry))
+_BOOK_CACHE_ERRORS = (OSError, EOFError, ValueError, KeyError, TypeError,
+                      zlib.error)
+if zstandard is not None:
+    _BOOK_CACHE_ERRORS += (zstandard.ZstdError,)
+
+
+# Section names and metadata values (e.g. "अर्थ", gana names) repeat
+# across thousands of entries; interning collapses them to one object
+_INTERN: Dict[str, str] = {}
+
+
+def _intern(s: str, max_len: int = 64) -> str:
+    """Return a shared instance of a short, likely-repeated string"""
+    if len(s) > max_len:
+        return s
+    return _INTERN.setdefault(s, s)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+class _TokenBucket:
+    """Thread-safe request pacer: releases one caller per `interval` seconds
+
+    Replaces fixed per-entry sleeps - cache hits pay nothing, and
+    concurrent fetchers share one aggregate rate toward the host instead
+    of each sleeping independently.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+
+# =====================================
+# Data Classes
+# =====================================
+
+# slots=True drops the per-instance __dict__ (~halves memory for the
+# ~4000 EntryInfo objects a big book creates); needs Python 3.10+
+_DC_OPTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DC_OPTS)
+class EntryInfo:
+    """Individual entry (sutra, dhatu, shabda, etc.)"""
+    number: str
+    title: str
+    url: str
+    content: str = ""
+    sections: Dict[str, str] = field(default_factory=dict)
+    notes: List[str] = field(default_factory=list)
+    metadata: Dict[str, str] = field(default_factory=dict)  # For kaumudi, gana, etc.
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialization dict (avoids dataclasses.asdict's deepcopy)"""
+        return {
+            'number': self.number,
+            'title': self.title,
+            'url': self.url,
+            'content': self.content,
+            'sections': self.sections,
+            'notes': self.notes,
+            'metadata': self.metadata,
+        }
+
+
+@dataclass(**_DC_OPTS)
+class ChapterInfo:
+    """Chapter/Section information"""
+    number: str
+    name: str
+    url: str
+    entries: List[EntryInfo] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialization dict (avoids dataclasses.asdict's deepcopy)"""
+        return {
+            'number': self.number,
+            'name': self.name,
+            'url': self.url,
+            'entries': [entry.to_dict() for entry in self.entries],
+        }
+
+
+@dataclass(**_DC_OPTS)
+class BookInfo:
+    """Book information"""
+    name: str
+    sanskrit_name: str
+    header_shlokas: List[str]
+    footer_title: str
+    base_url: str
+    book_type: str  # shivasutra, sutraani, dhatu, etc.
+    chapters: List[ChapterInfo] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialization dict (avoids dataclasses.asdict's deepcopy)"""
+        return {
+            'name': self.name,
+            'sanskrit_name': self.sanskrit_name,
+            'header_shlokas': self.header_shlokas,
+            'footer_title': self.footer_title,
+            'base_url': self.base_url,
+            'book_type': self.book_type,
+            'chapters': [chapter.to_dict() for chapter in self.chapters],
+        }
+
+    def to_json(self) -> bytes:
+        """Serialize the whole book to UTF-8 JSON bytes"""
+        return _json_dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, data: bytes) -> "BookInfo":
+        """Rebuild a BookInfo (with chapters and entries) from to_json output"""
+        raw = orjson.loads(data) if orjson is not None else json.loads(data)
+        return cls(
+            name=raw['name'],
+            sanskrit_name=raw['sanskrit_name'],
+            header_shlokas=raw['header_shlokas'],
+            footer_title=raw['footer_title'],
+            base_url=raw['base_url'],
+            book_type=raw['book_type'],
+            chapters=[
+                ChapterInfo(
+                    number=ch['number'],
+                    name=ch['name'],
+                    url=ch['url'],
+                    entries=[EntryInfo(**entry) for entry in ch['entries']],
+                )
+                for ch in raw['chapters']
+            ],
+        )
+
+
+# =====================================
+# Book Configurations
+# =====================================
+
+BOOK_CONFIGS = {
+    'shivasutra': {
+        'url': 'https://ashtadhyayi.com/shivasutra/',
+        'detail_url_pattern': '/shivasutra/{num}',
+        'has_infinite_scroll': False,
+        'organize_by': 'flat',  # All in one folder
+        'expected_count': 14,
+    },
+    'sutraani': {
+        'url': 'https://ashtadhyayi.com/sutraani',
+        'detail_url_pattern': '/sutraani/{a}/{p}/{s}',
+        # SPA master list (discovered via CDP Network.responseReceived);
+        # one GET replaces the whole infinite-scroll enumeration
+        'list_json': 'https://ashtadhyayi.com/data/sutraani.json',
+        'has_infinite_scroll': True,
+        'organize_by': 'adhyaya_pada',  # Nested folders
+        'expected_count': 3981,
+    },
+    'dhatu': {
+        'url': 'https://ashtadhyayi.com/dhatu/',
+        'detail_url_pattern': '/dhatu/{id}',
+        'list_json': 'https://ashtadhyayi.com/data/dhatu.json',
+        'has_infinite_scroll': True,
+        'organize_by': 'gana',  # Group by गण
+        'expected_count': 2000,
+    },
+    'pratyahara': {
+        'url': 'https://ashtadhyayi.com/pratyahara',
+        'detail_url_pattern': None,  # Single page
+        'has_infinite_scroll': False,
+        'organize_by': 'flat',
+        'expected_count': 44,
+    },
+    'ganapatha': {
+        'url': 'https://ashtadhyayi.com/ganapath/',
+        'detail_url_pattern': '/ganapath/{id}',
+        'list_json': 'https://ashtadhyayi.com/data/ganapath.json',
+        'has_infinite_scroll': True,
+        'organize_by': 'flat',
+        'expected_count': 450,
+    },
+    'unadipatha': {
+        'url': 'https://ashtadhyayi.com/unaadi/',
+        'detail_url_pattern': '/unaadi/{id}',
+        'list_json': 'https://ashtadhyayi.com/data/unaadi.json',
+        'has_infinite_scroll': True,
+        'organize_by': 'flat',
+        'expected_count': 750,
+    },
+    'linganushasanam': {
+        'url': 'https://ashtadhyayi.com/linganushasanam',
+        'detail_url_pattern': '/linganushasanam/{id}',
+        'has_infinite_scroll': False,
+        'organize_by': 'flat',
+        'expected_count': 200,
+    },
+    'shiksha': {
+        'url': 'https://ashtadhyayi.com/shiksha',
+        'detail_url_pattern': '/shiksha/{id}',
+        'has_infinite_scroll': False,
+        'organize_by': 'flat',
+        'expected_count': 60,
+    },
+}
+
+
+# Pre-bound URL builders: absolute template per book, bound format_map
+# so building one of ~4000 detail URLs is a single C call with no
+# per-row template re-parse or kwargs dict unpacking
+_URL_BUILDERS = {
+    book: ('https://ashtadhyayi.com' + cfg['detail_url_pattern']).format_map
+    for book, cfg in BOOK_CONFIGS.items()
+    if cfg.get('detail_url_pattern')
+}
+
+
+# =====================================
+# Compiled Patterns
+# =====================================
+
+# Hot-path regexes run once per entry (up to ~4000 times per book), so
+# compile them once at import instead of hitting re's pattern cache
+_RE_WS = re.compile(r'[ \t]+')
+_RE_EXTRA_NL = re.compile(r'\n{3,}')
+_RE_EMPTY_BOLD = re.compile(r'\*\*\s*\*\*')
+_RE_PUNCT_SPACE = re.compile(r'\s+([।॥,;:.])')
+
+# Tag/class dispatch sets for the single-pass markdown conversion -
+# set membership keeps every branch constant-time
+_MD_PRAKRIYA_CLASSES = {'prakriya', 'derivation', 'prakriya-box'}
+_MD_HEADER_TAGS = {'h3', 'h4', 'h5'}
+_MD_BOLD_TAGS = {'b', 'strong'}
+_MD_BOLD_CLASSES = {'font-weight-bold', 'bigtext-font'}
+_MD_ITALIC_TAGS = {'i', 'em'}
+_MD_PARA_DIV_CLASSES = {'mt-3', 'mt-4', 'mb-3', 'mb-4'}
+
+# Compiled XPaths for commentary extraction on the lxml fallback path
+# (used when selectolax is absent); etree.XPath compiles once and
+# evaluates in C across all detail pages
+if etree is not None:
+    _XP_COMMENTARY_REGIONS = etree.XPath(
+        "//*[starts-with(@id, 'sutra-commentary-') and "
+        "substring(@id, string-length(@id) - 6) = '-region']")
+    _XP_SECTION_TITLE = etree.XPath(
+        ".//*[contains(concat(' ', normalize-space(@class), ' '), "
+        "' list-item-title-color ')]")
+    _XP_SECTION_BODY = etree.XPath(
+        ".//*[contains(concat(' ', normalize-space(@class), ' '), "
+        "' sutra-commentary ')]")
+else:
+    _XP_COMMENTARY_REGIONS = _XP_SECTION_TITLE = _XP_SECTION_BODY = None
+
+
+def _lxml_inner_html(node) -> str:
+    """Serialize an lxml element's children (like BS4's decode_contents)"""
+    return (node.text or '') + ''.join(
+        etree.tostring(child, encoding='unicode') for child in node)
+
+
+# Selector strings built once at import; soupsieve caches compiled
+# selectors by string identity, so reusing the same object across pages
+# skips both the f-string concatenation and the cache lookup churn
+_HEADER_SEL = ("#list-group-content > .bg-light.list-group-item, "
+               "#list-group-content > .list-group-item.bg-light, "
+               ".list-group-item.text-center.bg-light")
+_ENTRY_SEL_BY_TYPE = {
+    'sutraani': "a.d-block[href^='/sutraani/'], a[href^='/sutraani/'].href",
+    'dhatu': "a[href^='/dhatu/']",
+}
+_ENTRY_SEL_DEFAULT = "#list-group-content .list-group-item"
+
+# Per-section markdown fragment, shared across the thousands of entry
+# files a book renders
+_SECTION_TMPL = "---\n\n## 📖 {}\n\n{}\n\n"
+_ADDL_PREFIX = "Additional_"
+
+# CLI banner separator, built once
+_SEP = "=" * 60 + "\n"
+
+# Valid sutra detail URLs are exactly /sutraani/adhyaya/pada/sutra; the
+# compiled match rejects index links like /sutraani/z or /sutraani/skn
+# without per-anchor split + int() attempts
+_RE_SUTRA_HREF = re.compile(r'^/sutraani/(\d+)/(\d+)/(\d+)$')
+
+# Class sets for the single-pass entry-list parse (see _parse_single_entry)
+_ENTRY_NUMBER_CLASSES = {'badge', 'font-weight-bold'}
+_ENTRY_TITLE_CLASSES = {'sutra-text', 'list-item-title'}
+_ENTRY_KAUMUDI_CLASSES = {'float-right', 'text-right', 'text-dark'}
+_ENTRY_PLAIN_DIV_SKIP = {'badge', 'float-right'}
+_ENTRY_NOTE_CLASSES = {'list-item-text', 'text-primary'}
+
+
+# =====================================
+# HTTP Session (static fetch path)
+# =====================================
+
+USER_AGENT = ("Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0 Safari/537.36")
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled keep-alive session for plain HTTP fetches"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=[429, 500, 502, 503, 504]),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'User-Agent': USER_AGENT, 'Accept-Language': 'hi,sa,en'})
+    return session
+
+
+# =====================================
+# Main Scraper Class
+# =====================================
+
+class AshtadhyayiScraper:
+    """
+    Universal scraper for ashtadhyayi.com
+    Handles all book types with automatic structure detection
+    """
+    
+    BASE_URL = "https://ashtadhyayi.com"
+    
+    # Devanagari to English number mapping
+    DEVA_TO_ENG = {
+        '०': '0', '१': '1', '२': '2', '३': '3', '४': '4', 
+        '५': '5', '६': '6', '७': '7', '८': '8', '९': '9',
+        # Gujarati numerals (sometimes appear)
+        '૦': '0', '૧': '1', '૨': '2', '૩': '3', '૪': '4',
+        '૫': '5', '૬': '6', '૭': '7', '૮': '8', '૯': '9',
+    }
+
+    # Precomputed for str.translate, which runs the whole conversion in C
+    _DEVA_TRANS = str.maketrans(DEVA_TO_ENG)
+    
+    # Cap simultaneous requests to stay polite to ashtadhyayi.com
+    MAX_CONCURRENCY = 8
+
+    def __init__(self, output_dir: str = "books", headless: bool = True,
+                 delay: float = 1.5, limit: int = None, verbose: bool = True,
+                 concurrency: int = 1, use_cache: bool = True,
+                 refresh: bool = False, cache_dir: str = ".cache/pages",
+                 processes: int = 1, use_async: bool = False,
+                 engine: str = 'selenium', driver_path: str = None,
+                 compress: str = 'none'):
+        """
+        Initialize the scraper
+
+        Args:
+            output_dir: Directory to save markdown files
+            headless: Run browser in headless mode
+            delay: Delay between requests (seconds)
+            limit: Maximum entries to scrape (None for all)
+            verbose: Print progress messages
+            concurrency: Parallel detail-page fetches (1 = sequential)
+            use_cache: Serve previously fetched pages from the disk cache
+            refresh: Re-download pages even when cached
+            cache_dir: Directory for the gzip-compressed page cache
+            processes: Worker processes for detail pages (1 = in-process);
+                each worker owns its own HTTP session (and browser, if the
+                Selenium fallback is needed), sidestepping thread-safety
+            use_async: Prefetch detail pages with httpx over one
+                multiplexed connection pool (requires httpx)
+            engine: Browser engine for JS rendering ('selenium' or
+                'playwright'; the latter requires the playwright package)
+            driver_path: Path to a chromedriver binary; skips Selenium
+                Manager's per-run version resolution (useful in CI where
+                the driver is pre-baked into the image)
+            compress: Compress emitted markdown files ('none', 'gz' or
+                'zst'; 'zst' needs the zstandard package)
+        """
+        self.output_dir = Path(output_dir)
+        self.delay = delay
+        self.limit = limit
+        self.verbose = verbose
+        self.driver = None
+        self.headless = headless
+        self.session = _build_session()
+        self.concurrency = max(1, min(concurrency, self.MAX_CONCURRENCY))
+        self._fetch_gate = threading.Semaphore(self.MAX_CONCURRENCY)
+        # Aggregate politeness rate: one network request per `delay`
+        # seconds, no matter how many threads are fetching
+        self._rate_gate = _TokenBucket(delay)
+        self._driver_lock = threading.Lock()
+        self.use_cache = use_cache
+        self.refresh = refresh
+        self.cache_dir = Path(cache_dir)
+        self._created_dirs: set = set()
+        self.processes = max(1, processes)
+        self.use_async = use_async and httpx is not None
+        if use_async and httpx is None:
+            self.log("⚠️ httpx not installed; --async ignored")
+        self._prefetched: Dict[str, str] = {}
+        self.driver_path = driver_path
+        self.compress = compress
+        if compress == 'zst' and zstandard is None:
+            self.log("⚠️ zstandard not installed; falling back to gzip output")
+            self.compress = 'gz'
+        self.engine = engine
+        if engine == 'playwright' and not HAS_PLAYWRIGHT:
+            self.log("⚠️ playwright not installed; falling back to selenium")
+            self.engine = 'selenium'
+
+    def log(self, message: str):
+        """Print message if verbose mode is on"""
+        if self.verbose:
+            print(message)
+        
+    def _init_driver(self):
+        """Initialize Chrome WebDriver"""
+        _load_selenium()
+        self.log("🔧 Initializing Chrome WebDriver...")
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--lang=hi,sa,en")
+        options.add_argument("--disable-extensions")
+        # Strip Chrome subsystems that only burn cycles for a scraper
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-sync")
+        options.add_argument("--disable-translate")
+        options.add_argument("--mute-audio")
+        # Persist the profile across runs so the SPA's JS bundles come
+        # from Chrome's disk cache instead of the network. Pool workers
+        # get their own profile - Chrome refuses to share one live profile
+        profile_dir = Path.home() / '.cache' / 'ashtadhyayi-scraper' / 'chrome-profile'
+        if multiprocessing.parent_process() is not None:
+            profile_dir = profile_dir.with_name(f"{profile_dir.name}-{os.getpid()}")
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument("--no-first-run")
+        options.add_argument("--disk-cache-size=536870912")  # 512MB
+        # Return from navigation on DOMContentLoaded instead of full load
+        options.page_load_strategy = 'eager'
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option('prefs', {
+            'intl.accept_languages': 'hi,sa,en',
+            # Only the DOM is needed to enumerate entries - skip assets
+            'profile.managed_default_content_settings.images': 2,
+            'profile.managed_default_content_settings.stylesheets': 2,
+            'profile.managed_default_content_settings.fonts': 2,
+        })
+
+        try:
+            # An explicit driver path skips Selenium Manager's network
+            # lookup/unpack on every cold start
+            if self.driver_path:
+                self.driver = webdriver.Chrome(service=Service(self.driver_path),
+                                               options=options)
+            else:
+                self.driver = webdriver.Chrome(options=options)
+            # Chrome startup costs seconds and ~200MB, so the instance is
+            # reused across books; make sure it dies with the process
+            atexit.register(self._close_driver)
+            # Belt and braces: also block asset requests at the network
+            # layer (the prefs above don't cover all asset types)
+            try:
+                self.driver.execute_cdp_cmd("Network.setBlockedURLs", {
+                    "urls": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg",
+                             "*.woff", "*.woff2", "*.ttf", "*.css"]
+                })
+                self.driver.execute_cdp_cmd("Network.enable", {})
+            except Exception:
+                pass  # CDP is Chrome-specific; ignore if unavailable
+            self.log("✅ Chrome WebDriver initialized successfully")
+        except Exception as e:
+            self.log(f"❌ Failed to initialize Chrome: {e}")
+            raise
+    
+    def _close_driver(self):
+        """Close WebDriver"""
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+    
+    def _wait_for_content(self, selector: str, timeout: int = 15) -> bool:
+        """Wait for element to be present"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            return True
+        except TimeoutException:
+            return False
+    
+    def _cache_path(self, url: str, scrolled: bool = False) -> Path:
+        """Content-addressed cache location for a URL
+
+        Scrolled list pages live under a separate key: a plain render of
+        the same URL (e.g. fetched for the README header) only holds the
+        first batch of entries and must never satisfy a scroll request.
+        """
+        key = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        suffix = '.scrolled' if scrolled else ''
+        return self.cache_dir / key[:2] / f"{key}{suffix}.html.gz"
+
+    def _cache_get(self, url: str, scrolled: bool = False) -> Optional[str]:
+        """Return cached page body, or None on miss"""
+        if not self.use_cache or self.refresh:
+            return None
+        path = self._cache_path(url, scrolled=scrolled)
+        if not path.exists():
+            return None
+        try:
+            return gzip.decompress(path.read_bytes()).decode('utf-8')
+        except (OSError, EOFError, zlib.error, UnicodeDecodeError):
+            return None  # Corrupt cache entry; re-fetch
+
+    def _cache_put(self, url: str, html: str, scrolled: bool = False):
+        """Store page body in the disk cache (best effort)"""
+        if not self.use_cache or not html:
+            return
+        path = self._cache_path(url, scrolled=scrolled)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(gzip.compress(html.encode('utf-8')))
+        except OSError as e:
+            self.log(f"   ⚠️ Could not cache {url}: {e}")
+
+    async def _afetch_all(self, urls: List[str], concurrency: int = 50) -> Dict[str, str]:
+        """Fetch many URLs concurrently over a shared httpx client"""
+        # Long keepalive so every page in a book rides the handshakes
+        # (TCP+TLS) paid for the first few requests
+        limits = httpx.Limits(max_keepalive_connections=20, max_connections=50,
+                              keepalive_expiry=60.0)
+        gate = asyncio.Semaphore(concurrency)
+        results: Dict[str, str] = {}
+
+        async with httpx.AsyncClient(http2=HTTPX_HTTP2, limits=limits, timeout=15.0,
+                                     headers={'User-Agent': USER_AGENT,
+                                              'Accept-Language': 'hi,sa,en'}) as client:
+            async def fetch(url: str):
+                async with gate:
+                    try:
+                        response = await client.get(url)
+                        response.raise_for_status()
+                        results[url] = response.text
+                    except httpx.HTTPError as e:
+                        self.log(f"   ⚠️ Async fetch failed for {url}: {e}")
+
+            await asyncio.gather(*(fetch(u) for u in urls))
+
+        return results
+
+    def _prefetch_async(self, urls: List[str]):
+        """Bulk-download detail pages ahead of the parse loop
+
+        Bodies land in an in-memory map consumed by _fetch_static (and
+        in the disk cache), so the rest of the pipeline is unchanged.
+        """
+        self.log(f"   ⚡ Prefetching {len(urls)} pages (async)...")
+        fetched = asyncio.run(self._afetch_all(urls))
+        for url, html in fetched.items():
+            self._cache_put(url, html)
+        self._prefetched.update(fetched)
+        self.log(f"   ⚡ Prefetched {len(fetched)}/{len(urls)} pages")
+
+    def _fetch_static(self, url: str) -> Optional[str]:
+        """Fetch a page over plain HTTP (no browser) via the pooled session"""
+        prefetched = self._prefetched.pop(url, None)
+        if prefetched is not None:
+            return prefetched
+        cached = self._cache_get(url)
+        if cached is not None:
+            self.log(f"   💾 Cache hit: {url}")
+            return cached
+        try:
+            with self._fetch_gate:
+                self._rate_gate.wait()
+                self.log(f"   📥 Fetching (static): {url}")
+                response = self.session.get(url, timeout=15)
+            response.raise_for_status()
+            self._cache_put(url, response.text)
+            return response.text
+        except requests.RequestException as e:
+            self.log(f"   ⚠️ Static fetch failed for {url}: {e}")
+            return None
+
+    _LIST_SELECTOR = "#list-group-content, .list-group-content, .list-group"
+
+    async def _arender_playwright(self, url: str, scroll: bool) -> str:
+        """Render a page (optionally scrolling to the end) with Playwright"""
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless)
+            context = await browser.new_context(locale='hi')
+            page = await context.new_page()
+            try:
+                await page.goto(url, wait_until='domcontentloaded')
+                try:
+                    await page.wait_for_selector(self._LIST_SELECTOR, timeout=15000)
+                except Exception:
+                    pass  # Selector is best-effort, as on the Selenium path
+
+                if scroll:
+                    last_count = 0
+                    stable = 0
+                    while stable < 2:
+                        count = await page.evaluate(
+                            "document.querySelectorAll("
+                            "'a[href].d-block, .list-group-item a[href]').length")
+                        if self.limit and count >= self.limit:
+                            break
+                        if count == last_count:
+                            stable += 1
+                        else:
+                            stable = 0
+                            last_count = count
+                        await page.evaluate(
+                            "window.scrollTo(0, document.body.scrollHeight)")
+                        await page.wait_for_timeout(300)
+
+                return await page.content()
+            finally:
+                await browser.close()
+
+    def _render_playwright(self, url: str, scroll: bool = False) -> Optional[str]:
+        """Sync wrapper around the async Playwright renderer"""
+        try:
+            self.log(f"   📥 Rendering (playwright): {url}")
+            return asyncio.run(self._arender_playwright(url, scroll))
+        except Exception as e:
+            self.log(f"   ❌ Playwright render failed for {url}: {e}")
+            return None
+
+    def _get_page_source(self, url: str, wait_selector: str = None,
+                         scroll: bool = False) -> Optional[str]:
+        """Navigate to URL and get page source after JavaScript renders
+
+        With scroll=True the infinite-scroll list is exhausted first and
+        the post-scroll source is what gets returned (and cached under
+        its own key), so a cache hit never short-circuits the
+        enumeration - a plain render of the same URL cannot satisfy a
+        scroll request.
+        """
+        # Rendered pages are cached too, so development re-runs skip the
+        # browser entirely (use --refresh to bypass)
+        cached = self._cache_get(url, scrolled=scroll)
+        if cached is not None and self._looks_rendered(cached):
+            return cached
+        # A limited run would cache a truncated list; only cache scrolled
+        # pages when the full enumeration ran
+        cacheable = not (scroll and self.limit)
+        if self.engine == 'playwright':
+            html = self._render_playwright(url, scroll=scroll)
+            if html:
+                if cacheable:
+                    self._cache_put(url, html, scrolled=scroll)
+                return html
+            # Fall through to Selenium if Playwright could not render
+        # WebDriver is not thread-safe, so serialize browser navigations
+        with self._driver_lock:
+            if not self.driver:
+                self._init_driver()
+            try:
+                self.log(f"   📥 Loading: {url}")
+                self.driver.get(url)
+                time.sleep(self.delay)
+
+                if wait_selector:
+                    self._wait_for_content(wait_selector, timeout=15)
+                else:
+                    self._wait_for_content("#list-group-content, .list-group-content, .list-group", timeout=15)
+
+                if scroll:
+                    self._scroll_to_load_all()
+
+                html = self.driver.page_source
+                if html and cacheable:
+                    self._cache_put(url, html, scrolled=scroll)
+                return html
+            except Exception as e:
+                self.log(f"   ❌ Error loading {url}: {e}")
+                return None
+    
+    def _deva_to_english(self, text: str) -> str:
+        """Convert Devanagari/Gujarati numbers to English"""
+        return str(text).translate(self._DEVA_TRANS)
+
+    @staticmethod
+    def _soup(html: str) -> BeautifulSoup:
+        """Parse HTML with the fastest available BeautifulSoup backend"""
+        return BeautifulSoup(html, BS_PARSER)
+
+    @staticmethod
+    def _tree(html: str) -> "HTMLParser":
+        """Parse HTML with selectolax (callers must check HAS_SELECTOLAX)"""
+        return HTMLParser(html)
+    
+    def _html_to_markdown(self, html: str) -> str:
+        """Convert HTML content to well-formatted Markdown - keeps paragraphs together"""
+        if not html:
+            return ""
+        
+        soup = self._soup(html)
+        
+        # First pass: Mark paragraph boundaries with special markers
+        PARA_BREAK = "\n\n【PARA】\n\n"
+        LINE_BREAK = "\n"
+        
+        # One traversal collects the nodes for every rule, then the rules
+        # run bucket-by-bucket in the same order as the original per-rule
+        # select() passes. The ordering matters: inline markup (bold,
+        # italic, br, separators) must be rewritten before the margin-div
+        # and link rules flatten their containers, or nested formatting is
+        # dropped. Fusing the walks keeps traversal O(N) while preserving
+        # those pass semantics exactly.
+        prakriyas = []
+        headers = []
+        bold_tags = []
+        bold_classes = []
+        italics = []
+        brs = []
+        separators = []
+        para_divs = []
+        links = []
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+            name = node.name
+            classes = set(node.get('class') or ())
+            if classes & _MD_PRAKRIYA_CLASSES:
+                prakriyas.append(node)
+            if name in _MD_HEADER_TAGS or 'section-header' in classes:
+                headers.append(node)
+            if name in _MD_BOLD_TAGS:
+                bold_tags.append(node)
+            if classes & _MD_BOLD_CLASSES:
+                bold_classes.append(node)
+            if name in _MD_ITALIC_TAGS:
+                italics.append(node)
+            if name == 'br':
+                brs.append(node)
+            if name == 'hr' or 'section-separator' in classes:
+                separators.append(node)
+            if name == 'div' and classes & _MD_PARA_DIV_CLASSES:
+                para_divs.append(node)
+            if name == 'a':
+                links.append(node)
+
+        def attached(node: Tag) -> bool:
+            # A node replaced (or inside a subtree replaced) by an earlier
+            # rule no longer reaches the root
+            parent = node.parent
+            while parent is not None and parent is not soup:
+                parent = parent.parent
+            return parent is soup
+
+        # Handle prakriya (derivation) boxes - convert to blockquotes
+        for node in prakriyas:
+            if attached(node):
+                text = node.get_text(strip=True)
+                if text:
+                    node.replace_with(soup.new_string(f"{PARA_BREAK}> {text}{PARA_BREAK}"))
+
+        # Handle section headers (major section titles)
+        for node in headers:
+            if attached(node):
+                text = node.get_text(strip=True)
+                if text:
+                    node.replace_with(soup.new_string(f"{PARA_BREAK}### {text}{PARA_BREAK}"))
+
+        # Handle bold text inline (tags first, then bold-styled classes)
+        for bucket in (bold_tags, bold_classes):
+            for node in bucket:
+                if attached(node):
+                    text = node.get_text(strip=True)
+                    if text:
+                        node.replace_with(f"**{text}**")
+
+        # Handle italic text inline
+        for node in italics:
+            if attached(node):
+                text = node.get_text(strip=True)
+                if text:
+                    node.replace_with(f"*{text}*")
+
+        # Handle <br> as line breaks within paragraph
+        for node in brs:
+            if attached(node):
+                node.replace_with(LINE_BREAK)
+
+        # Handle section separators as paragraph breaks
+        for node in separators:
+            if attached(node):
+                node.replace_with(f"{PARA_BREAK}---{PARA_BREAK}")
+
+        # Handle divs with significant margin as paragraph breaks
+        for node in para_divs:
+            if attached(node):
+                text = node.get_text(strip=True)
+                if text:
+                    node.replace_with(f"{PARA_BREAK}{text}{PARA_BREAK}")
+
+        # Handle links - convert to inline
+        for node in links:
+            if attached(node):
+                text = node.get_text(strip=True)
+                href = node.get('href', '')
+                if text and href:
+                    node.replace_with(f"[{text}]({href})")
+                elif text:
+                    node.replace_with(text)
+
+        # Get text with single space separator (not newline!)
+        # This keeps inline text together
+        text = soup.get_text(separator=' ')
+        
+        # Clean up the text
+        # Replace multiple spaces with single space
+        text = _RE_WS.sub(' ', text)
+        
+        # Process paragraph markers
+        # Split by paragraph markers
+        paragraphs = text.split('【PARA】')
+        
+        result_paragraphs = []
+        for para in paragraphs:
+            para = para.strip()
+            if not para:
+                continue
+            
+            # Handle derivation arrows - format nicely
+            if '→' in para and not para.startswith('>'):
+                # Split derivation steps
+                steps = para.split('→')
+                if len(steps) > 1:
+                    formatted_steps = []
+                    for i, step in enumerate(steps):
+                        step = step.strip()
+                        if step:
+                            if i == 0:
+                                formatted_steps.append(step)
+                            else:
+                                formatted_steps.append(f"→ {step}")
+                    para = "\n\n".join(formatted_steps)
+            
+            result_paragraphs.append(para)
+        
+        # Join paragraphs with double newlines
+        text = '\n\n'.join(result_paragraphs)
+        
+        # Final cleanup
+        text = _RE_EXTRA_NL.sub('\n\n', text)
+        text = _RE_EMPTY_BOLD.sub('', text)  # Remove empty bolds
+        text = _RE_PUNCT_SPACE.sub(r'\1', text)  # Fix punctuation spacing
+        text = text.strip()
+
+        return text
+
+    def _render_commentary(self, node) -> str:
+        """Render a commentary node to markdown
+
+        Short-circuits to plain text extraction when the node holds no
+        child elements, avoiding a second HTML parse for the many small
+        text-only sections; otherwise defers to _html_to_markdown.
+        Text containing derivation arrows or line breaks still takes the
+        full path, which formats arrow chains step-per-paragraph and
+        keeps intentional newlines. Accepts BS4 Tags, lxml elements and
+        selectolax nodes.
+        """
+        if isinstance(node, Tag):
+            if not any(isinstance(c, Tag) for c in node.children):
+                raw = node.get_text()
+                if '→' not in raw and '\n' not in raw:
+                    text = " ".join(raw.split())
+                    return _RE_PUNCT_SPACE.sub(r'\1', text)
+            return self._html_to_markdown(node.decode_contents())
+        if etree is not None and isinstance(node, etree._Element):
+            if len(node) == 0:
+                raw = node.text_content()
+                if '→' not in raw and '\n' not in raw:
+                    text = " ".join(raw.split())
+                    return _RE_PUNCT_SPACE.sub(r'\1', text)
+            return self._html_to_markdown(_lxml_inner_html(node))
+        # selectolax node
+        if next(node.iter(include_text=False), None) is None:
+            raw = node.text(deep=True)
+            if '→' not in raw and '\n' not in raw:
+                text = " ".join(raw.split())
+                return _RE_PUNCT_SPACE.sub(r'\1', text)
+        return self._html_to_markdown(node.html)
+
+    # Scrolls down and resolves as soon as new nodes are inserted (or a
+    # safety timeout fires), instead of sleeping a fixed interval.
+    # arguments[0] is the timeout in ms, adapted to how fast the site
+    # actually served the previous batch
+    _SCROLL_AND_WAIT_JS = """
+        const timeoutMs = arguments[0];
+        const done = arguments[arguments.length - 1];
+        const target = document.querySelector(
+            '#list-group-content, .list-group-content, .list-group') || document.body;
+        const observer = new MutationObserver(() => {
+            observer.disconnect();
+            done(true);
+        });
+        observer.observe(target, {childList: true, subtree: true});
+        window.scrollTo(0, document.body.scrollHeight);
+        setTimeout(() => { observer.disconnect(); done(false); }, timeoutMs);
+    """
+
+    # Bounds for the adaptive scroll wait (milliseconds)
+    _SCROLL_TIMEOUT_MIN_MS = 250
+    _SCROLL_TIMEOUT_MAX_MS = 3000
+
+    def _scroll_to_load_all(self, max_scrolls: int = 500) -> int:
+        """Scroll page to load all content (for infinite scroll pages)"""
+        self.log("   📜 Loading all content (infinite scroll)...")
+
+        last_count = 0
+        scroll_count = 0
+        no_change_count = 0
+        timeout_ms = self._SCROLL_TIMEOUT_MAX_MS
+        self.driver.set_script_timeout(10)
+
+        while scroll_count < max_scrolls:
+            # Count items in one JS call - find_elements pays a WebDriver
+            # JSON round-trip per element, querySelectorAll().length pays one
+            current_count = self.driver.execute_script(
+                "return document.querySelectorAll("
+                "'a[href].d-block, .list-group-item a[href]').length")
+
+            if current_count == last_count:
+                no_change_count += 1
+                if no_change_count >= 2:  # No new items after 2 waits
+                    break
+            else:
+                no_change_count = 0
+                last_count = current_count
+
+            # Apply limit if set
+            if self.limit and current_count >= self.limit:
+                self.log(f"   ⏹️ Reached limit of {self.limit} entries")
+                break
+
+            # Scroll down and wake up as soon as the next batch renders
+            try:
+                t0 = time.perf_counter()
+                mutated = self.driver.execute_async_script(
+                    self._SCROLL_AND_WAIT_JS, timeout_ms)
+            except TimeoutException:
+                break
+            if mutated:
+                # Give the next wait ~2x the observed render time, so a
+                # fast site isn't penalized by the worst-case timeout
+                dt_ms = (time.perf_counter() - t0) * 1000
+                timeout_ms = int(max(self._SCROLL_TIMEOUT_MIN_MS,
+                                     min(self._SCROLL_TIMEOUT_MAX_MS, dt_ms * 2)))
+            else:
+                # Timed out without new nodes - back off to the cap once
+                timeout_ms = self._SCROLL_TIMEOUT_MAX_MS
+            scroll_count += 1
+
+            if scroll_count % 20 == 0:
+                self.log(f"   📊 Loaded {current_count} entries...")
+
+        self.log(f"   ✅ Total entries loaded: {last_count}")
+        return last_count
+    
+    def _parse_main_page_header(self, soup: BeautifulSoup) -> Tuple[str, List[str], str]:
+        """Parse header content (title, shlokas, footer)"""
+        # Main title
+        title_elem = soup.select_one(".list-group-title")
+        main_title = title_elem.get_text(strip=True) if title_elem else ""
+        
+        # Header shlokas
+        header_shlokas = []
+        header_items = soup.select(_HEADER_SEL)
+        for item in header_items:
+            text = item.get_text(strip=True)
+            if text and not item.select_one("a[href]"):
+                header_shlokas.append(text)
+        
+        # Footer title
+        footer_elem = soup.select_one(".list-group-end-title")
+        footer_title = footer_elem.get_text(strip=True) if footer_elem else ""
+        
+        return main_title, header_shlokas, footer_title
+    
+    def _entry_from_json_row(self, row: Dict[str, Any], book_type: str,
+                             config: Dict[str, Any], index: int) -> Optional[Dict[str, Any]]:
+        """Build one entries_data dict from a master-list JSON row"""
+        if not isinstance(row, dict):
+            return None
+        build_url = _URL_BUILDERS.get(book_type)
+        if build_url is None:
+            return None
+
+        def pick(*keys) -> str:
+            for k in keys:
+                if row.get(k):
+                    return str(row[k])
+            return ""
+
+        number = pick('number', 'num', 'n', 'i', 'id')
+        title = pick('title', 'sutra', 'text', 'word', 'name', 't')
+        pattern = config.get('detail_url_pattern') or ''
+
+        # Fill the URL template from whatever key style the row uses
+        fields = {}
+        if '{a}' in pattern:  # sutraani: /sutraani/{a}/{p}/{s}
+            a, p, s = pick('a', 'adhyaya'), pick('p', 'pada'), pick('s', 'sutra_num')
+            if not (a and p and s):
+                parts = self._deva_to_english(number).split('.')
+                if len(parts) == 3:
+                    a, p, s = parts
+            if not (a and p and s):
+                return None
+            fields = {'a': a, 'p': p, 's': s}
+            number = number or f"{a}.{p}.{s}"
+        else:
+            entry_id = pick('id', 'i', 'num', 'number') or str(index)
+            fields = {'id': entry_id, 'num': entry_id}
+
+        try:
+            url = build_url(fields)
+        except (KeyError, IndexError):
+            return None
+
+        entry = {
+            'number': number or str(index),
+            'title': title,
+            'url': url,
+            'notes': [],
+            'metadata': {_intern(k): _intern(str(v)) for k, v in fields.items()},
+        }
+
+        # Some master lists carry the full body; capturing it here lets
+        # _scrape_entry skip the per-entry detail fetch entirely
+        content = pick('content', 'meaning', 'artha', 'vritti', 'description', 'desc')
+        if content:
+            entry['content'] = content
+
+        return entry
+
+    def _fetch_list_json(self, book_type: str, config: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the SPA's master list JSON and build entries_data from it
+
+        Returns None when the endpoint is missing or unusable so the
+        caller can fall back to browser-based enumeration.
+        """
+        url = config.get('list_json')
+        if not url:
+            return None
+
+        body = self._fetch_static(url)
+        if not body:
+            return None
+
+        try:
+            data = json.loads(body)
+        except ValueError:
+            self.log(f"   ⚠️ {url} did not return valid JSON")
+            return None
+
+        rows = data.values() if isinstance(data, dict) else data
+        results = []
+        for index, row in enumerate(rows, 1):
+            entry = self._entry_from_json_row(row, book_type, config, index)
+            if entry:
+                results.append(entry)
+                if self.limit and len(results) >= self.limit:
+                    break
+
+        if not results:
+            self.log(f"   ⚠️ No usable entries in {url}")
+            return None
+
+        expected = config.get('expected_count')
+        if expected and not self.limit and len(results) < expected:
+            self.log(f"   ⚠️ JSON list has {len(results)} entries, expected ~{expected}")
+
+        return results
+
+    def _parse_entry_links(self, soup: BeautifulSoup, book_type: str) -> List[Dict[str, Any]]:
+        """Parse entry links from main page based on book type"""
+        results = []
+        
+        # Select all entry items
+        selector = _ENTRY_SEL_BY_TYPE.get(book_type, _ENTRY_SEL_DEFAULT)
+        if book_type == 'sutraani':
+            # Regex-prefilter the hrefs so invalid anchors never reach the
+            # per-item parser
+            items = [a for a in soup.select(selector)
+                     if _RE_SUTRA_HREF.match(a.get('href', ''))]
+        else:
+            items = soup.select(selector)
+        
+        for item in items:
+            entry_data = self._parse_single_entry(item, book_type)
+            if entry_data:
+                results.append(entry_data)
+                
+                if self.limit and len(results) >= self.limit:
+                    break
+        
+        return results
+    
+    def _parse_single_entry(self, item, book_type: str) -> Optional[Dict[str, Any]]:
+        """Parse a single entry from the list"""
+        # For sutraani
+        if book_type == 'sutraani':
+            if item.name == 'a':
+                href = item.get('href', '')
+
+                # Filter out non-sutra links like /sutraani/z, /sutraani/skn;
+                # the compiled regex validates and captures A/P/S in one step
+                match = _RE_SUTRA_HREF.match(href)
+                if not match:
+                    return None
+                adhyaya, pada, sutra_num = match.groups()
+
+                # One walk over the item subtree instead of three select_one
+                # calls (each a fresh traversal); first match wins, as with
+                # select_one's document order
+                number = title = None
+                kaumudi_text = None
+                for node in item.descendants:
+                    if not isinstance(node, Tag):
+                        continue
+                    classes = set(node.get('class') or ())
+                    if number is None and classes & _ENTRY_NUMBER_CLASSES:
+                        number = node.get_text(strip=True)
+                    if title is None and (classes & _ENTRY_TITLE_CLASSES or
+                                          (node.name == 'div' and
+                                           not classes & _ENTRY_PLAIN_DIV_SKIP)):
+                        title = node.get_text(strip=True)
+                    if kaumudi_text is None and classes & _ENTRY_KAUMUDI_CLASSES:
+                        kaumudi_text = node.get_text(strip=True)
+                    if number is not None and title is not None and kaumudi_text is not None:
+                        break
+                if number is None:
+                    number = f"{adhyaya}.{pada}.{sutra_num}"
+                if title is None:
+                    title = ""
+                kaumudi = kaumudi_text if kaumudi_text and 'कौमुदी' in kaumudi_text else ""
+
+                # If title not found, try getting full text minus number and kaumudi
+                if not title:
+                    full_text = item.get_text(strip=True)
+                    if number:
+                        full_text = full_text.replace(number, '', 1)
+                    if kaumudi:
+                        full_text = full_text.replace(kaumudi, '', 1)
+                    title = full_text.strip()
+                
+                # Get notes (siblings with bullet points)
+                notes = []
+                sibling = item.find_next_sibling()
+                while sibling and sibling.name != 'a':
+                    text = sibling.get_text(strip=True)
+                    if text.startswith('•'):
+                        notes.append(text)
+                    sibling = sibling.find_next_sibling()
+                
+                return {
+                    'number': number,
+                    'title': title,
+                    'url': self.BASE_URL + href,
+                    'notes': notes,
+                    'metadata': {'kaumudi': _intern(kaumudi)} if kaumudi else {},
+                    'adhyaya': adhyaya,
+                    'pada': pada,
+                    'sutra': sutra_num
+                }
+        
+        # For simple books (shivasutra, etc.)
+        else:
+            # Skip bg-light items (header shlokas)
+            if 'bg-light' in item.get('class', []):
+                return None
+            
+            # Single traversal collecting link, number, title and notes
+            # (replaces four select/select_one passes over the same subtree)
+            href = None
+            number = ""
+            title = ""
+            notes = []
+            for node in item.descendants:
+                if not isinstance(node, Tag):
+                    continue
+                classes = set(node.get('class') or ())
+                if href is None and node.name == 'a' and 'href' in node.attrs:
+                    href = node.get('href', '')
+                if not number and 'badge' in classes:
+                    number = node.get_text(strip=True)
+                if not title and 'list-item-title' in classes:
+                    title = node.get_text(strip=True)
+                if classes & _ENTRY_NOTE_CLASSES:
+                    text = node.get_text(strip=True)
+                    if text:
+                        notes.append(text)
+
+            if not href or href == '#':
+                return None
+
+            # Build URL
+            if href.startswith('/'):
+                full_url = self.BASE_URL + href
+            elif href.startswith('http'):
+                full_url = href
+            else:
+                full_url = self.BASE_URL + '/' + href
+
+            return {
+                'number': number,
+                'title': title,
+                'url': full_url,
+                'notes': notes,
+                'metadata': {}
+            }
+    
+    def _parse_detail_fast(self, html: str) -> Dict[str, Any]:
+        """Parse an entry detail page with selectolax (C hot path)
+
+        Mirrors the BeautifulSoup logic in _parse_detail_page but does
+        field extraction through selectolax; only commentary bodies that
+        need markdown conversion still go through _html_to_markdown.
+        """
+        tree = self._tree(html)
+
+        # Get title from title-font or list-group-title
+        title_node = tree.css_first(".title-font, .list-group-title")
+        title = title_node.text(strip=True) if title_node else ""
+
+        # Parse number from title (format: १.१.१ वृद्धिरादैच्)
+        parts = title.split(" ", 1) if title else ["", ""]
+        number = parts[0].strip()
+        entry_title = parts[1].strip() if len(parts) > 1 else title
+
+        sections = {}
+        main_content = ""
+        summary_content = ""
+
+        # === EXTRACT SUMMARY SECTION (पदच्छेद, अनुवृत्ति, etc.) ===
+        summary_region = tree.css_first("#sutra-summary-region")
+        if summary_region:
+            summary_items = []
+            for item in summary_region.css(".list-group-item, .row"):
+                label_node = item.css_first(".col-3, .col-4, .text-muted, label")
+                value_node = item.css_first(".col-9, .col-8")
+                if label_node and value_node:
+                    label = label_node.text(strip=True).rstrip(':')
+                    value = value_node.text(strip=True)
+                    if label and value:
+                        summary_items.append(f"**{label}:** {value}")
+                else:
+                    # Single item
+                    text = item.text(strip=True)
+                    if text and len(text) < 200:
+                        summary_items.append(text)
+
+            if summary_items:
+                summary_content = "\n\n".join(summary_items)
+
+        # === EXTRACT MAIN MEANING (Short definition) ===
+        short_meaning = ""
+        short_node = tree.css_first(".bigtext-font, .sutra-meaning-short")
+        if short_node:
+            short_meaning = f"**{short_node.text(strip=True)}**"
+
+        # === EXTRACT MAIN EXPLANATION from sutrartha region ===
+        sutrartha = tree.css_first("#sutra-commentary-sutrartha-region .sutra-commentary")
+        if sutrartha:
+            main_content = self._render_commentary(sutrartha)
+
+        # Combine short meaning with main content
+        if short_meaning and main_content:
+            main_content = f"{short_meaning}\n\n{main_content}"
+        elif short_meaning:
+            main_content = short_meaning
+
+        # Add summary to sections if available
+        if summary_content:
+            sections["सूत्र-विवरण (Summary)"] = summary_content
+
+        # === GET ALL COMMENTARY SECTIONS ===
+        for region in tree.css("[id^='sutra-commentary-'][id$='-region']"):
+            # Skip sutrartha (already captured as main content)
+            if 'sutrartha' in (region.attributes.get('id') or ''):
+                continue
+
+            # Get section title
+            title_node = region.css_first(".list-item-title-color")
+            section_name = title_node.text(strip=True) if title_node else ""
+            if not section_name:
+                continue
+
+            # Get section content
+            content_node = region.css_first(".sutra-commentary")
+            if content_node:
+                content_text = self._render_commentary(content_node)
+                if content_text.strip():
+                    sections[_intern(section_name)] = content_text
+
+        # Fallback: If no sutrartha found, try the first highlighted text
+        if not main_content:
+            first_content = tree.css_first(".bigtext-font, .font-weight-bold")
+            if first_content:
+                main_content = first_content.text(strip=True)
+
+        return {
+            'number': number,
+            'title': entry_title,
+            'content': main_content,
+            'sections': sections
+        }
+
+    # Markers that distinguish server-rendered content from an empty SPA
+    # shell that still needs JavaScript to fill in
+    _RENDERED_MARKERS = ('sutra-commentary', 'title-font', 'list-group-title')
+
+    @classmethod
+    def _looks_rendered(cls, html: str) -> bool:
+        """True when static HTML already contains the content nodes"""
+        return any(marker in html for marker in cls._RENDERED_MARKERS)
+
+    def _parse_detail_page(self, url: str) -> Optional[Dict[str, Any]]:
+        """Parse individual entry detail page"""
+        # Try the cheap static fetch first; fall back to the browser when
+        # the response is only the unrendered SPA shell
+        html = self._fetch_static(url)
+        if html and not self._looks_rendered(html):
+            self.log(f"   ↩️ Static HTML is an empty shell, rendering: {url}")
+            html = None
+        if not html:
+            html = self._get_page_source(url)
+        if not html:
+            return None
+
+        if HAS_SELECTOLAX:
+            return self._parse_detail_fast(html)
+
+        soup = self._soup(html)
+        
+        # Get title from title-font or list-group-title
+        title_elem = soup.select_one(".title-font, .list-group-title")
+        title = title_elem.get_text(strip=True) if title_elem else ""
+        
+        # Parse number from title (format: १.१.१ वृद्धिरादैच्)
+        parts = title.split(" ", 1) if title else ["", ""]
+        number = parts[0].strip()
+        entry_title = parts[1].strip() if len(parts) > 1 else title
+        
+        # Get main content and sections
+        sections = {}
+        main_content = ""
+        summary_content = ""
+        
+        # === EXTRACT SUMMARY SECTION (पदच्छेद, अनुवृत्ति, etc.) ===
+        summary_region = soup.select_one("#sutra-summary-region")
+        if summary_region:
+            summary_items = []
+            for item in summary_region.select(".list-group-item, .row"):
+                label_elem = item.select_one(".col-3, .col-4, .text-muted, label")
+                value_elem = item.select_one(".col-9, .col-8")
+                if label_elem and value_elem:
+                    label = label_elem.get_text(strip=True).rstrip(':')
+                    value = value_elem.get_text(strip=True)
+                    if label and value:
+                        summary_items.append(f"**{label}:** {value}")
+                else:
+                    # Single item
+                    text = item.get_text(strip=True)
+                    if text and len(text) < 200:
+                        summary_items.append(text)
+            
+            if summary_items:
+                summary_content = "\n\n".join(summary_items)
+        
+        # === EXTRACT MAIN MEANING (Short definition) ===
+        short_meaning = ""
+        short_elem = soup.select_one(".bigtext-font, .sutra-meaning-short")
+        if short_elem:
+            short_meaning = f"**{short_elem.get_text(strip=True)}**"
+        
+        # === EXTRACT MAIN EXPLANATION AND COMMENTARY SECTIONS ===
+        # Prefer the compiled-XPath walk over the lxml tree - one C-level
+        # evaluation per page instead of CSS selectors per region
+        if _XP_COMMENTARY_REGIONS is not None:
+            root = lxml_html.fromstring(html)
+            region_sections = []
+            for region in _XP_COMMENTARY_REGIONS(root):
+                bodies = _XP_SECTION_BODY(region)
+                if 'sutrartha' in (region.get('id') or ''):
+                    if bodies:
+                        main_content = self._render_commentary(bodies[0])
+                    continue
+                titles = _XP_SECTION_TITLE(region)
+                section_name = titles[0].text_content().strip() if titles else ""
+                if section_name and bodies:
+                    region_sections.append((section_name, bodies[0]))
+        else:
+            region_sections = []
+            for region in soup.select("[id^='sutra-commentary-'][id$='-region']"):
+                content_elem = region.select_one(".sutra-commentary")
+                if 'sutrartha' in region.get('id', ''):
+                    if content_elem:
+                        main_content = self._render_commentary(content_elem)
+                    continue
+                title_elem = region.select_one(".list-item-title-color")
+                section_name = title_elem.get_text(strip=True) if title_elem else ""
+                if section_name and content_elem:
+                    region_sections.append((section_name, content_elem))
+
+        # Combine short meaning with main content
+        if short_meaning and main_content:
+            main_content = f"{short_meaning}\n\n{main_content}"
+        elif short_meaning:
+            main_content = short_meaning
+
+        # Add summary to sections if available
+        if summary_content:
+            sections["सूत्र-विवरण (Summary)"] = summary_content
+
+        for section_name, content_elem in region_sections:
+            content_text = self._render_commentary(content_elem)
+            if content_text.strip():
+                sections[_intern(section_name)] = content_text
+
+        # Fallback: If no sutrartha found, try getting from first list-group-item
+        if not main_content:
+            first_content = soup.select_one(".bigtext-font, .font-weight-bold")
+            if first_content:
+                main_content = first_content.get_text(strip=True)
+        
+        return {
+            'number': number,
+            'title': entry_title,
+            'content': main_content,
+            'sections': sections
+        }
+    
+    def _scrape_entry(self, i: int, total: int, data: Dict[str, Any]) -> EntryInfo:
+        """Fetch and build one entry (safe to call from worker threads)"""
+        self.log(f"\n   [{i}/{total}] {data.get('number', '')}. {data.get('title', '')[:30]}...")
+
+        # Get detail page content, unless the master JSON already
+        # delivered the body for this entry
+        detail = None
+        if not data.get('content'):
+            detail = self._parse_detail_page(data['url'])
+
+        entry = EntryInfo(
+            number=data.get('number', ''),
+            title=data.get('title', ''),
+            url=data['url'],
+            content=data.get('content') or (detail['content'] if detail else ''),
+            sections=detail['sections'] if detail else {},
+            notes=data.get('notes', []),
+            metadata=data.get('metadata', {})
+        )
+
+        if not entry.number:
+            entry.number = detail['number'] if detail else str(i)
+        if not entry.title:
+            entry.title = detail['title'] if detail else ''
+
+        return entry
+
+    def _write_ndjson(self, fh, entry: EntryInfo):
+        """Append one entry to the open NDJSON stream"""
+        fh.write(_json_dumps(entry.to_dict()))
+        fh.write(b"\n")
+
+    def scrape_book(self, book_name: str) -> BookInfo:
+        """
+        Scrape a complete book
+        
+        Args:
+            book_name: Name of book (shivasutra, sutraani, dhatu, etc.)
+        
+        Returns:
+            BookInfo object with all scraped data
+        """
+        if book_name not in BOOK_CONFIGS:
+            available = ", ".join(BOOK_CONFIGS.keys())
+            raise ValueError(f"Unknown book: {book_name}. Available: {available}")
+        
+        config = BOOK_CONFIGS[book_name]
+
+        try:
+            self.log(f"\n📚 Scraping book: {book_name}")
+            self.log(f"   URL: {config['url']}")
+
+            # Fastest path: the SPA's master list JSON enumerates every
+            # entry in one GET, skipping infinite scroll entirely
+            entries_data = self._fetch_list_json(book_name, config)
+
+            if entries_data is not None:
+                self.log(f"   📋 Found {len(entries_data)} entries (JSON list)")
+                # Header/footer are nice-to-have, but the static fetch
+                # only returns the SPA shell for some books - render
+                # those so the README keeps its title and shlokas
+                html = self._fetch_static(config['url'])
+                if html and not self._looks_rendered(html):
+                    self.log(f"   ↩️ Static HTML is an empty shell, rendering: {config['url']}")
+                    html = None
+                if not html:
+                    html = self._get_page_source(config['url'])
+                soup = self._soup(html) if html else None
+                if soup:
+                    sanskrit_name, header_shlokas, footer_title = self._parse_main_page_header(soup)
+                else:
+                    sanskrit_name, header_shlokas, footer_title = "", [], ""
+            else:
+                # Load main page - infinite-scroll lists need the browser,
+                # everything else can come over plain HTTP
+                if config['has_infinite_scroll']:
+                    # Scrolling lives inside _get_page_source so a cache
+                    # hit already holds the fully enumerated list
+                    html = self._get_page_source(config['url'], scroll=True)
+                    if not html:
+                        raise Exception("Failed to load main page")
+                else:
+                    html = self._fetch_static(config['url'])
+                    if not html:
+                        html = self._get_page_source(config['url'])
+                    if not html:
+                        raise Exception("Failed to load main page")
+
+                soup = self._soup(html)
+
+                # Parse header
+                sanskrit_name, header_shlokas, footer_title = self._parse_main_page_header(soup)
+                self.log(f"   📜 Title: {sanskrit_name}")
+                self.log(f"   📝 Header shlokas: {len(header_shlokas)}")
+
+                # Parse entry links
+                entries_data = self._parse_entry_links(soup, book_name)
+                self.log(f"   📋 Found {len(entries_data)} entries")
+            
+            # Create book object
+            book = BookInfo(
+                name=book_name,
+                sanskrit_name=sanskrit_name,
+                header_shlokas=header_shlokas,
+                footer_title=footer_title,
+                base_url=config['url'],
+                book_type=book_name,
+                chapters=[]
+            )
+            
+            # Create chapter for entries
+            chapter = ChapterInfo(
+                number="1",
+                name=book_name,
+                url=config['url'],
+                entries=[]
+            )
+            
+            # Scrape each entry's detail page; entries are also streamed
+            # to an NDJSON sidecar as they complete, so a crash partway
+            # through a big book doesn't lose everything
+            if self.limit:
+                entries_data = entries_data[:self.limit]
+            total = len(entries_data)
+
+            # Bulk-prefetch whatever still needs a network round trip
+            if self.use_async:
+                pending = [d['url'] for d in entries_data
+                           if not d.get('content') and self._cache_get(d['url']) is None]
+                if pending:
+                    self._prefetch_async(pending)
+
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            ndjson_path = self.output_dir / f"{book_name}.ndjson"
+
+            with open(ndjson_path, 'wb') as ndjson_file:
+                if self.processes > 1:
+                    # Shard entries across worker processes, each with its
+                    # own session/driver (see _init_worker); imap keeps
+                    # results in submission order
+                    worker_kwargs = dict(
+                        output_dir=str(self.output_dir),
+                        headless=self.headless,
+                        # N workers in parallel: shrink the per-worker
+                        # delay so the aggregate request rate to the
+                        # host stays at roughly one per self.delay
+                        delay=self.delay / self.processes,
+                        verbose=False,
+                        use_cache=self.use_cache,
+                        refresh=self.refresh,
+                        cache_dir=str(self.cache_dir),
+                        driver_path=self.driver_path,
+                        engine=self.engine,
+                    )
+                    jobs = [(i, total, data) for i, data in enumerate(entries_data, 1)]
+                    with multiprocessing.Pool(self.processes,
+                                              initializer=_init_worker,
+                                              initargs=(worker_kwargs,)) as pool:
+                        for entry in pool.imap(_scrape_entry_in_worker, jobs):
+                            chapter.entries.append(entry)
+                            self._write_ndjson(ndjson_file, entry)
+                            self.log(f"   ✅ [{len(chapter.entries)}/{total}] {entry.number}")
+                elif self.concurrency > 1:
+                    # I/O-bound fetches parallelize well; order is preserved
+                    # by writing results back at each entry's original index
+                    chapter.entries = [None] * total
+                    with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                        futures = {
+                            executor.submit(self._scrape_entry, i, total, data): i
+                            for i, data in enumerate(entries_data, 1)
+                        }
+                        for future in as_completed(futures):
+                            i = futures[future]
+                            entry = future.result()
+                            chapter.entries[i - 1] = entry
+                            self._write_ndjson(ndjson_file, entry)
+                else:
+                    # Pacing happens in the fetch layer (_rate_gate), so
+                    # cached or JSON-provided entries don't pay the delay
+                    for i, data in enumerate(entries_data, 1):
+                        entry = self._scrape_entry(i, total, data)
+                        chapter.entries.append(entry)
+                        self._write_ndjson(ndjson_file, entry)
+
+            self.log(f"   💾 Streamed entries to: {ndjson_path}")
+            book.chapters.append(chapter)
+            self.log(f"\n✅ Successfully scraped {len(chapter.entries)} entries")
+
+            # Persist the parsed book so markdown/template tweaks can be
+            # re-run from load_book() without scraping again
+            self._dump_book_cache(book)
+
+            return book
+
+        except Exception:
+            # Keep the driver alive on success so it can be reused for
+            # the next book; tear it down only on failure
+            self._close_driver()
+            raise
+
+    def close(self):
+        """Release the browser and HTTP session"""
+        self._close_driver()
+        self.session.close()
+
+    def _book_cache_path(self, book_name: str) -> Path:
+        ext = 'zst' if zstandard is not None else 'gz'
+        return self.output_dir / f"{book_name}.cache.json.{ext}"
+
+    def _dump_book_cache(self, book: BookInfo):
+        """Write the parsed book to a compressed JSON cache (best effort)"""
+        path = self._book_cache_path(book.name)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = book.to_json()
+            if zstandard is not None:
+                payload = zstandard.ZstdCompressor().compress(payload)
+            else:
+                payload = gzip.compress(payload)
+            path.write_bytes(payload)
+            self.log(f"   💾 Book cache: {path}")
+        except OSError as e:
+            self.log(f"   ⚠️ Could not write book cache: {e}")
+
+    def load_book(self, book_name: str) -> Optional[BookInfo]:
+        """Load a previously scraped book from its cache file, or None
+
+        Lets save_to_markdown run standalone - iterating on the markdown
+        templates costs CPU seconds instead of a full re-scrape.
+        """
+        for path in (self.output_dir / f"{book_name}.cache.json.zst",
+                     self.output_dir / f"{book_name}.cache.json.gz"):
+            if not path.exists():
+                continue
+            try:
+                payload = path.read_bytes()
+                if path.suffix == '.zst':
+                    if zstandard is None:
+                        continue  # Written by an env that had zstandard
+                    payload = zstandard.ZstdDecompressor().decompress(payload)
+                else:
+                    payload = gzip.decompress(payload)
+                return BookInfo.from_json(payload)
+            except _BOOK_CACHE_ERRORS as e:
+                self.log(f"   ⚠️ Could not load book cache {path}: {e}")
+        return None
+    
+    def _ensure_dir(self, path: Path):
+        """mkdir -p with a per-run cache so each directory costs one syscall"""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+
+    def save_to_markdown(self, book: BookInfo, output_dir: str = None) -> Path:
+        """Save book to markdown files"""
+        output_path = Path(output_dir) if output_dir else self.output_dir
+        book_dir = output_path / book.name
+        self._ensure_dir(book_dir)
+        
+        self.log(f"\n📁 Saving to: {book_dir}")
+        
+        config = BOOK_CONFIGS.get(book.book_type, {})
+        organize_by = config.get('organize_by', 'flat')
+        
+        # Render everything first, collecting (path, bytes) pairs so the
+        # disk writes can be overlapped afterwards; encoding happens here
+        # once instead of inside each writer thread
+        payloads: List[Tuple[Path, bytes]] = [
+            (book_dir / "README.md", self._create_readme(book).encode('utf-8'))]
+
+        for chapter in book.chapters:
+            for entry in chapter.entries:
+                # Determine file path based on organization
+                if organize_by == 'adhyaya_pada' and '.' in entry.number:
+                    parts = self._deva_to_english(entry.number).split('.')
+                    if len(parts) >= 3:
+                        adhyaya_dir = book_dir / f"adhyaya_{parts[0]}"
+                        pada_dir = adhyaya_dir / f"pada_{parts[1]}"
+                        filename = f"sutra_{parts[2].zfill(3)}.md"
+                        file_path = pada_dir / filename
+                    else:
+                        filename = self._get_entry_filename(entry)
+                        file_path = book_dir / filename
+                else:
+                    filename = self._get_entry_filename(entry)
+                    file_path = book_dir / filename
+
+                payloads.append((file_path,
+                                 self._create_entry_markdown(entry, book).encode('utf-8')))
+
+        # One mkdir pass over the unique parents, then parallel writes -
+        # page-cache writes overlap well across threads
+        for parent in {path.parent for path, _ in payloads}:
+            self._ensure_dir(parent)
+
+        def _write_one(payload: Tuple[Path, bytes]):
+            path, content = payload
+            # Compression runs in the writer threads; zlib/zstd release
+            # the GIL, so it overlaps with the other writes
+            if self.compress == 'gz':
+                path = path.with_name(path.name + '.gz')
+                content = gzip.compress(content, compresslevel=1)
+            elif self.compress == 'zst':
+                path = path.with_name(path.name + '.zst')
+                content = zstandard.compress(content, 3)
+            path.write_bytes(content)
+            self.log(f"   ✅ Created: {path.relative_to(book_dir)}")
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(_write_one, payloads))
+
+        self.log(f"\n🎉 All files saved to: {book_dir}")
+        return book_dir
+    
+    def _get_entry_filename(self, entry: EntryInfo) -> str:
+        """Generate filename for entry"""
+        eng_num = self._deva_to_english(entry.number)
+        
+        # Handle dot-separated numbers
+        if '.' in eng_num:
+            parts = eng_num.split('.')
+            eng_num = '_'.join(p.zfill(2) for p in parts)
+        elif eng_num.isdigit():
+            eng_num = eng_num.zfill(2)
+        
+        return f"entry_{eng_num}.md"
+    
+    def _create_readme(self, book: BookInfo) -> str:
+        """Create README.md content"""
+        # Accumulate parts and join once - += in the entries loop copies
+        # the whole README per row, which is quadratic on big books
+        lines = [f"""<div align="center">
+
+# {book.sanskrit_name if book.sanskrit_name else book.name.title()}
+
+"""]
+
+        # Add header shlokas
+        for shloka in book.header_shlokas:
+            lines.append(f"*{shloka}*\n\n")
+
+        lines.append(f"""---
+
+📖 **स्रोतः (Source):** [{book.base_url}]({book.base_url})
+
+</div>
+
+---
+
+## 📋 सूचि (Index)
+
+| क्र. | नाम | विवरणम् |
+|:---:|:-----|:--------|
+""")
+        
+        config = BOOK_CONFIGS.get(book.book_type, {})
+        organize_by = config.get('organize_by', 'flat')
+        
+        for chapter in book.chapters:
+            for entry in chapter.entries:
+                eng_num = self._deva_to_english(entry.number)
+                
+                # Generate correct file path based on organization
+                if organize_by == 'adhyaya_pada' and hasattr(entry, 'metadata') and entry.metadata.get('adhyaya'):
+                    adhyaya = entry.metadata.get('adhyaya', '1')
+                    pada = entry.metadata.get('pada', '1')
+                    sutra = entry.metadata.get('sutra', '1')
+                    filepath = f"adhyaya_{adhyaya}/pada_{pada}/sutra_{str(sutra).zfill(3)}.md"
+                elif '.' in eng_num and organize_by == 'adhyaya_pada':
+                    parts = eng_num.split('.')
+                    if len(parts) >= 3:
+                        filepath = f"adhyaya_{parts[0]}/pada_{parts[1]}/sutra_{parts[2].zfill(3)}.md"
+                    else:
+                        filepath = self._get_entry_filename(entry)
+                else:
+                    filepath = self._get_entry_filename(entry)
+                
+                # Add metadata if available
+                extra = ""
+                if entry.metadata.get('kaumudi'):
+                    extra = f" ({entry.metadata['kaumudi']})"
+                
+                lines.append(f"| {entry.number} | **{entry.title}**{extra} | [{filepath}](./{filepath}) |\n")
+
+        lines.append(f"""
+---
+
+<div align="center">
+
+{f"*{book.footer_title}*" if book.footer_title else ""}
+
+</div>
+""")
+        return "".join(lines)
+    
+    def _create_entry_markdown(self, entry: EntryInfo, book: BookInfo) -> str:
+        """Create markdown content for an entry"""
+        parts = [f"""<div align="center">
+
+# {entry.number}. {entry.title}
+
+"""]
+
+        # Add metadata
+        if entry.metadata.get('kaumudi'):
+            parts.append(f"**{entry.metadata['kaumudi']}**\n\n")
+
+        parts.append(f"""📖 **स्रोतः:** [{entry.url}]({entry.url})
+
+</div>
+
+---
+
+## 📜 विवरणम् (Explanation)
+
+{entry.content if entry.content else "*विवरणं अनुपलब्धम्*"}
+
+""")
+
+        # Add notes
+        if entry.notes:
+            parts.append("""---
+
+## 📝 टिप्पणी (Notes)
+
+""")
+            for note in entry.notes:
+                parts.append(f"- {note}\n")
+            parts.append("\n")
+
+        # Add sections - one join over the filtered items, formatted
+        # through the module-level template
+        parts.append("".join(
+            _SECTION_TMPL.format(section_name, section_content)
+            for section_name, section_content in entry.sections.items()
+            if section_content.strip() and not section_name.startswith(_ADDL_PREFIX)))
+
+        # Navigation footer
+        parts.append("""---
+
+<div align="center">
+
+[🏠 मुख्यपृष्ठम्](./README.md)
+
+</div>
+""")
+        return "".join(parts)
+
+
+# =====================================
+# Multiprocess Workers
+# =====================================
+
+# Per-process scraper, created once by the pool initializer so each
+# worker keeps its own HTTP session (and Chrome, if ever needed) warm
+_worker_scraper: Optional[AshtadhyayiScraper] = None
+
+
+def _init_worker(scraper_kwargs: Dict[str, Any]):
+    """Pool initializer: build this process's scraper instance"""
+    global _worker_scraper
+    _worker_scraper = AshtadhyayiScraper(**scraper_kwargs)
+
+
+def _scrape_entry_in_worker(job: Tuple[int, int, Dict[str, Any]]) -> EntryInfo:
+    """Scrape one entry inside a pool worker"""
+    i, total, data = job
+    # Pacing lives in the worker's own _rate_gate (the parent divided the
+    # delay by the worker count), so cache hits cost nothing here either
+    return _worker_scraper._scrape_entry(i, total, data)
+
+
+# =====================================
+# CLI Interface
+# =====================================
+
+def main():
+    """Main entry point with CLI support"""
+    # Only the CLI needs argparse; importing it here keeps programmatic
+    # use of the module (and pool workers re-importing it) a touch leaner
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="🕉️ Ashtadhyayi.com Universal Book Scraper",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python ashtadhyayi_scraper.py --book shivasutra
+  python ashtadhyayi_scraper.py --book sutraani --limit 100
+  python ashtadhyayi_scraper.py --book dhatu --output ./my_books --delay 2.0
+  
+Available Books:
+  shivasutra, sutraani, dhatu, pratyahara, ganapatha, 
+  unadipatha, linganushasanam, shiksha
+        """
+    )
+    
+    parser.add_argument(
+        '--book', '-b',
+        required=True,
+        choices=list(BOOK_CONFIGS.keys()) + ['all'],
+        help="Book to scrape ('all' scrapes every configured book)"
+    )
+    
+    parser.add_argument(
+        '--output', '-o',
+        default='./books',
+        help="Output directory (default: ./books)"
+    )
+    
+    parser.add_argument(
+        '--limit', '-l',
+        type=int,
+        default=None,
+        help="Maximum entries to scrape (for testing)"
+    )
+    
+    parser.add_argument(
+        '--delay', '-d',
+        type=float,
+        default=1.5,
+        help="Delay between requests in seconds (default: 1.5)"
+    )
+    
+    parser.add_argument(
+        '--concurrency', '-c',
+        type=int,
+        default=1,
+        help="Parallel detail-page fetches (default: 1, max: 8)"
+    )
+
+    parser.add_argument(
+        '--processes', '-p',
+        type=int,
+        default=1,
+        help="Worker processes for detail pages (default: 1)"
+    )
+
+    parser.add_argument(
+        '--engine',
+        choices=['selenium', 'playwright'],
+        default='selenium',
+        help="Browser engine for JS-rendered pages (default: selenium)"
+    )
+
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help="Prefetch detail pages concurrently with httpx"
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help="Disable the on-disk page cache"
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help="Re-download pages even if they are cached"
+    )
+
+    parser.add_argument(
+        '--compress',
+        choices=['none', 'gz', 'zst'],
+        default='none',
+        help="Write markdown files compressed (.md.gz/.md.zst); note the "
+             "README index links assume uncompressed .md files"
+    )
+
+    parser.add_argument(
+        '--driver-path',
+        default=None,
+        help="Path to a chromedriver binary (skips Selenium Manager lookup)"
+    )
+
+    parser.add_argument(
+        '--no-headless',
+        action='store_true',
+        help="Show browser window (for debugging)"
+    )
+    
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help="Suppress progress messages"
+    )
+    
+    args = parser.parse_args()
+
+    # --quiet means quiet: skip the banner entirely; otherwise emit it as
+    # one write instead of seven print calls
+    if not args.quiet:
+        banner = [
+            _SEP,
+            "🕉️  Ashtadhyayi.com Universal Book Scraper v3.0\n",
+            _SEP,
+            f"📚 Book: {args.book}\n",
+            f"📁 Output: {args.output}\n",
+        ]
+        if args.limit:
+            banner.append(f"⏹️ Limit: {args.limit} entries\n")
+        banner.append(_SEP)
+        sys.stdout.write("".join(banner))
+
+
+    # Create scraper
+    scraper = AshtadhyayiScraper(
+        output_dir=args.output,
+        headless=not args.no_headless,
+        delay=args.delay,
+        limit=args.limit,
+        verbose=not args.quiet,
+        concurrency=args.concurrency,
+        use_cache=not args.no_cache,
+        refresh=args.refresh,
+        processes=args.processes,
+        use_async=args.use_async,
+        engine=args.engine,
+        driver_path=args.driver_path,
+        compress=args.compress
+    )
+
+    try:
+        books = list(BOOK_CONFIGS.keys()) if args.book == 'all' else [args.book]
+
+        for book_name in books:
+            # Scrape the book
+            book = scraper.scrape_book(book_name)
+
+            # Save to Markdown
+            output_path = scraper.save_to_markdown(book, output_dir=args.output)
+
+            if not args.quiet:
+                sys.stdout.write(
+                    f"\n{_SEP}✅ SUCCESS! Files saved to: {output_path}\n{_SEP}")
+
+    except Exception as e:
+        # Diagnostics belong on stderr; the full traceback only when not
+        # quiet (or explicitly requested via env), since formatting it
+        # costs tens of ms on the failure path
+        sys.stderr.write(f"\n❌ ERROR: {e}\n")
+        if not args.quiet or os.environ.get('ASHTADHYAYI_DEBUG'):
+            import traceback
+            traceback.print_exc()
+        return 1
+    finally:
+        scraper.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())